@@ -1,4 +1,4 @@
-from typing import Literal, Tuple
+from typing import Literal, Optional, Tuple
 import os
 import math
 import re
@@ -6,6 +6,35 @@ import re
 from fabric_generator.fabric import Fabric, Tile, Port, Bel, IO
 from fabric_generator.code_generator import codeGenerator
 from fabric_generator.fabric import ConfigBitMode
+from fabric_generator.file_parser import cacheByFileVersion
+
+# Verilog style indexing and ranges to VHDL style indexing
+_VERILOG_INDEX = str.maketrans({"[": "(", "]": ")", ":": " downto "})
+
+
+@cacheByFileVersion
+def _componentDeclaration(fileName: str) -> Tuple[Optional[str], int]:
+    """
+    Read a VHDL file and turn its entity into a component declaration. The same tile files are declared in every
+    super tile and in the fabric, so the result is cached on the file name, modification time and size.
+
+    Returns:
+        Tuple[Optional[str], int]: The component declaration (None if no entity is found) and 1 if the config port is used
+    """
+    configPortUsed = 0  # 1 means is used
+    with open(fileName, 'r') as f:
+        data = f.read()
+
+    if result := re.search(r"NumberOfConfigBits.*?(\d+)", data, flags=re.IGNORECASE):
+        configPortUsed = 1
+        if result.group(1) == '0':
+            configPortUsed = 0
+
+    if result := re.search(r"^entity.*?end entity.*?;",
+                           data, flags=re.MULTILINE | re.DOTALL):
+        result = result.group(0)
+        result = result.replace("entity", "component")
+    return result, configPortUsed
 
 
 class VHDLWriter(codeGenerator):
@@ -115,10 +144,8 @@ class VHDLWriter(codeGenerator):
         if type(right) == list:
             self._add(f"{left} <= {' & '.join(right)} after {delay} ps;", indentLevel)
         else:
-            left = str(left).replace(":", " downto ").replace(
-                "[", "(").replace("]", ")")
-            right = str(right).replace(":", " downto ").replace(
-                "[", "(").replace("]", ")")
+            left = str(left).translate(_VERILOG_INDEX)
+            right = str(right).translate(_VERILOG_INDEX)
             self._add(f"{left} <= {right} after {delay} ps;", indentLevel)
 
     def addAssignVector(self, left, right, widthL, widthR, indentLevel=0):
@@ -138,39 +165,31 @@ class VHDLWriter(codeGenerator):
             self._add(f")", indentLevel=indentLevel+1)
 
         self._add(f"Port map(", indentLevel=indentLevel + 1)
-        connectPair = []
-        for i in portsPairs:
-            if "[" in i[0]:
-                port = i[0].replace(
-                    "[", "(").replace("]", ")").replace(":", " downto ")
-            else:
-                port = i[0]
-            if "[" in i[1]:
-                signal = i[1].replace(
-                    "[", "(").replace("]", ")").replace(":", " downto ")
-            else:
-                signal = i[1]
-            connectPair.append(f"{port} => {signal}")
+        def toVHDL(x):
+            return x.translate(_VERILOG_INDEX) if "[" in x else x
 
         self._add(
-            (",\n"f"{' ':<{4*(indentLevel + 2)}}").join(connectPair), indentLevel=indentLevel + 2)
+            (",\n"f"{' ':<{4*(indentLevel + 2)}}").join(
+                f"{toVHDL(port)} => {toVHDL(signal)}" for port, signal in portsPairs),
+            indentLevel=indentLevel + 2)
         self._add(");", indentLevel=indentLevel + 1)
         self.addNewLine()
 
+    def addBufferArray(self, compName, compInsName, inputSignal, outputSignal, count, offset=0, indentLevel=0):
+        if count <= 0:
+            return
+        indent = "    " * indentLevel
+        mapIndent = "    " * (indentLevel + 1)
+        portIndent = "    " * (indentLevel + 2)
+        self._add("\n".join(f"{indent}{compInsName}_{i - offset} : {compName}\n"
+                            f"{mapIndent}Port map(\n"
+                            f"{portIndent}A => {inputSignal}({i}),\n"
+                            f"{portIndent}X => {outputSignal}({i})\n"
+                            f"{mapIndent});\n"
+                            for i in range(offset, count + offset)))
+
     def addComponentDeclarationForFile(self, fileName):
-        configPortUsed = 0  # 1 means is used
-        with open(fileName, 'r') as f:
-            data = f.read()
-
-        if result := re.search(r"NumberOfConfigBits.*?(\d+)", data, flags=re.IGNORECASE):
-            configPortUsed = 1
-            if result.group(1) == '0':
-                configPortUsed = 0
-
-        if result := re.search(r"^entity.*?end entity.*?;",
-                               data, flags=re.MULTILINE | re.DOTALL):
-            result = result.group(0)
-            result = result.replace("entity", "component")
+        result, configPortUsed = _componentDeclaration(fileName)
 
         self._add(result)
         self.addNewLine()
@@ -5,6 +5,10 @@ import re
 from fabric_generator.fabric import Tile, Bel, ConfigBitMode, IO
 from fabric_generator.code_generator import codeGenerator
 
+_NCB_RE = re.compile(rb"NumberOfConfigBits.*?(\d+)", flags=re.IGNORECASE)
+# VHDL style indexing to Verilog style indexing
+_VHDL_INDEX = str.maketrans("()", "[]")
+
 
 class VerilogWriter(codeGenerator):
     """
@@ -104,27 +108,32 @@ class VerilogWriter(codeGenerator):
         else:
             self._add(f"{compName} {compInsName} (", indentLevel=indentLevel)
 
-        connectPair = []
-        for i in portsPairs:
-            if "(" in i[1]:
-                tmp = i[1].replace("(", "[").replace(")", "]")
-            else:
-                tmp = i[1]
-            connectPair.append(f".{i[0]}({tmp})")
-
         self._add(
-            (",\n"f"{' ':<{4*(indentLevel + 1)}}").join(connectPair), indentLevel=indentLevel + 1)
+            (",\n"f"{' ':<{4*(indentLevel + 1)}}").join(
+                f".{port}({signal.translate(_VHDL_INDEX)})" for port, signal in portsPairs),
+            indentLevel=indentLevel + 1)
         self._add(");", indentLevel=indentLevel)
         self.addNewLine()
 
+    def addBufferArray(self, compName, compInsName, inputSignal, outputSignal, count, offset=0, indentLevel=0):
+        if count <= 0:
+            return
+        indent = "    " * indentLevel
+        portIndent = "    " * (indentLevel + 1)
+        self._add("\n".join(f"{indent}{compName} {compInsName}_{i - offset} (\n"
+                            f"{portIndent}.A({inputSignal}[{i}]),\n"
+                            f"{portIndent}.X({outputSignal}[{i}])\n"
+                            f"{indent});\n"
+                            for i in range(offset, count + offset)))
+
     def addComponentDeclarationForFile(self, fileName):
         configPortUsed = 0  # 1 means is used
-        with open(fileName, 'r') as f:
+        with open(fileName, 'rb') as f:
             data = f.read()
 
-        if result := re.search(r"NumberOfConfigBits.*?(\d+)", data, flags=re.IGNORECASE):
+        if result := _NCB_RE.search(data):
             configPortUsed = 1
-            if result.group(1) == '0':
+            if result.group(1) == b'0':
                 configPortUsed = 0
 
         return configPortUsed
@@ -23,9 +23,9 @@ class codeGenerator(abc.ABC):
         if self._outFileName == "":
             print("OutFileName is not set")
             exit(-1)
-        with open(self._outFileName, 'w') as f:
-            self._content = [i for i in self._content if i is not None]
-            f.write("\n".join(self._content))
+        # the whole file is encoded once and written as a single bytes blob, skipping the text layer
+        with open(self._outFileName, 'wb') as f:
+            f.write("\n".join(i for i in self._content if i is not None).encode())
         self._content = []
 
     @outFileName.setter
@@ -36,7 +36,7 @@ class codeGenerator(abc.ABC):
         if indentLevel == 0:
             self._content.append(line)
         else:
-            self._content.append(f"{' ':<{4*indentLevel}}" + line)
+            self._content.append("    " * indentLevel + line)
 
     def popLastLine(self) -> str:
         return self._content.pop()
@@ -355,6 +355,36 @@ class codeGenerator(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def addBufferArray(self, compName: str, compInsName: str, inputSignal: str, outputSignal: str, count: int, offset=0, indentLevel=0):
+        """
+        Add **count** instantiations of a buffer component with the input port A and the output port X. The i-th
+        instance is named **compInsName**_i and buffers bit i+**offset** of the input signal to the same bit of the
+        output signal. The result is the same as calling addInstantiation for every bit, but the whole array is
+        formatted in one go.
+
+        Examples :
+            | Verilog: **compName** **compInsName**_i (
+            |             .A(**inputSignal**[i+**offset**]),
+            |             .X(**outputSignal**[i+**offset**])
+            |         );
+            | VHDL: **compInsName**_i : **compName**
+            |         Port map(
+            |             A => **inputSignal**(i+**offset**),
+            |             X => **outputSignal**(i+**offset**)
+            |         );
+
+        Args:
+            compName (str): name of the buffer component
+            compInsName (str): name prefix of the buffer instances
+            inputSignal (str): the signal connected to the A port
+            outputSignal (str): the signal connected to the X port
+            count (int): the number of buffers
+            offset (int, optional): the index of the first buffered bit. Defaults to 0.
+            indentLevel (int, optional): The indentation Level. Defaults to 0.
+        """
+        pass
+
     @abc.abstractmethod
     def addComponentDeclarationForFile(self, fileName: str):
         """
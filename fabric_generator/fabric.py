@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Literal, List, Dict, Tuple
 import math
 from enum import Enum
@@ -308,29 +309,58 @@ class Tile():
             return False
         return self.name == __o.name
 
+    @cached_property
+    def portsBySide(self) -> Dict[Side, List[Port]]:
+        """
+        The ports of the tile grouped by the side of the tile they are located on, with the "NULL" ports removed.
+        The ports are scanned once and the order of `portsInfo` is kept within each side.
+
+        Returns:
+            Dict[Side, List[Port]]: The dictionary from the side of the tile to the ports on that side
+        """
+        ports = {side: [] for side in Side}
+        for p in self.portsInfo:
+            if p.name != "NULL":
+                ports[p.sideOfTile].append(p)
+        return ports
+
+    @cached_property
+    def portsByDirection(self) -> Dict[Direction, List[Port]]:
+        """
+        The ports of the tile grouped by their wire direction. The ports are scanned once and the order of
+        `portsInfo` is kept within each direction.
+
+        Returns:
+            Dict[Direction, List[Port]]: The dictionary from the wire direction to the ports with that direction
+        """
+        ports = {direction: [] for direction in Direction}
+        for p in self.portsInfo:
+            ports[p.wireDirection].append(p)
+        return ports
+
     def getWestSidePorts(self) -> List[Port]:
-        return [p for p in self.portsInfo if p.sideOfTile == Side.WEST and p.name != "NULL"]
+        return list(self.portsBySide[Side.WEST])
 
     def getEastSidePorts(self) -> List[Port]:
-        return [p for p in self.portsInfo if p.sideOfTile == Side.EAST and p.name != "NULL"]
+        return list(self.portsBySide[Side.EAST])
 
     def getNorthSidePorts(self) -> List[Port]:
-        return [p for p in self.portsInfo if p.sideOfTile == Side.NORTH and p.name != "NULL"]
+        return list(self.portsBySide[Side.NORTH])
 
     def getSouthSidePorts(self) -> List[Port]:
-        return [p for p in self.portsInfo if p.sideOfTile == Side.SOUTH and p.name != "NULL"]
+        return list(self.portsBySide[Side.SOUTH])
 
     def getNorthPorts(self, io: IO) -> List[Port]:
-        return [p for p in self.portsInfo if p.wireDirection == Direction.NORTH and p.name != "NULL" and p.inOut == io]
+        return [p for p in self.portsByDirection[Direction.NORTH] if p.name != "NULL" and p.inOut == io]
 
     def getSouthPorts(self, io: IO) -> List[Port]:
-        return [p for p in self.portsInfo if p.wireDirection == Direction.SOUTH and p.name != "NULL" and p.inOut == io]
+        return [p for p in self.portsByDirection[Direction.SOUTH] if p.name != "NULL" and p.inOut == io]
 
     def getEastPorts(self, io: IO) -> List[Port]:
-        return [p for p in self.portsInfo if p.wireDirection == Direction.EAST and p.name != "NULL" and p.inOut == io]
+        return [p for p in self.portsByDirection[Direction.EAST] if p.name != "NULL" and p.inOut == io]
 
     def getWestPorts(self, io: IO) -> List[Port]:
-        return [p for p in self.portsInfo if p.wireDirection == Direction.WEST and p.name != "NULL" and p.inOut == io]
+        return [p for p in self.portsByDirection[Direction.WEST] if p.name != "NULL" and p.inOut == io]
 
     def getTileInputNames(self) -> List[str]:
         return [p.destinationName for p in self.portsInfo if p.destinationName != "NULL" and p.wireDirection != Direction.JUMP and p.inOut == IO.INPUT]
@@ -358,6 +388,23 @@ class SuperTile():
     bels: List[Bel] = field(default_factory=list)
     withUserCLK: bool = False
 
+    @cached_property
+    def tileBoundaries(self) -> List[List[Tuple[bool, bool, bool, bool]]]:
+        """
+        For every location of the tile map, whether there is no tile to the north, east, south and west of it. Being on
+        the edge of the tile map counts as having no tile. The table is built once, so the neighbour tests do not redo
+        the bound checks and tile map lookups.
+
+        Returns:
+            List[List[Tuple[bool, bool, bool, bool]]]: The (north, east, south, west) flags, indexed by [y][x]
+        """
+        height, width = len(self.tileMap), len(self.tileMap[0])
+        return [[(y == 0 or self.tileMap[y-1][x] is None,
+                  x == width - 1 or self.tileMap[y][x+1] is None,
+                  y == height - 1 or self.tileMap[y+1][x] is None,
+                  x == 0 or self.tileMap[y][x-1] is None)
+                 for x in range(width)] for y in range(height)]
+
     def getPortsAroundTile(self) -> Dict[str, List[List[Port]]]:
         """
         Return all the ports that are around the super tile. The dictionary key is the location of where the tile located in the super tile map with the format of "X{x}Y{y}" where x is the x coordinate of the tile and y is the y coordinate of the tile. The top left tile will have key "00".
@@ -368,16 +415,17 @@ class SuperTile():
         ports = {}
         for y, row in enumerate(self.tileMap):
             for x, tile in enumerate(row):
-                if self.tileMap[y][x] == None:
+                if tile is None:
                     continue
+                north, east, south, west = self.tileBoundaries[y][x]
                 ports[f"{x},{y}"] = []
-                if y - 1 < 0 or self.tileMap[y-1][x] == None:
+                if north:
                     ports[f"{x},{y}"].append(tile.getNorthSidePorts())
-                if x + 1 >= len(self.tileMap[y]) or self.tileMap[y][x+1] == None:
+                if east:
                     ports[f"{x},{y}"].append(tile.getEastSidePorts())
-                if y + 1 >= len(self.tileMap) or self.tileMap[y+1][x] == None:
+                if south:
                     ports[f"{x},{y}"].append(tile.getSouthSidePorts())
-                if x - 1 < 0 or self.tileMap[y][x-1] == None:
+                if west:
                     ports[f"{x},{y}"].append(tile.getWestSidePorts())
         return ports
 
@@ -392,16 +440,17 @@ class SuperTile():
         internalConnections = []
         for y, row in enumerate(self.tileMap):
             for x, tile in enumerate(row):
-                if 0 <= y - 1 < len(self.tileMap) and self.tileMap[y-1][x] != None:
+                north, east, south, west = self.tileBoundaries[y][x]
+                if not north:
                     internalConnections.append(
                         (tile.getNorthSidePorts(), x, y))
-                if 0 <= x + 1 < len(self.tileMap[0]) and self.tileMap[y][x+1] != None:
+                if not east:
                     internalConnections.append(
                         (tile.getEastSidePorts(), x, y))
-                if 0 <= y + 1 < len(self.tileMap) and self.tileMap[y+1][x] != None:
+                if not south:
                     internalConnections.append(
                         (tile.getSouthSidePorts(), x, y))
-                if 0 <= x - 1 < len(self.tileMap[0]) and self.tileMap[y][x-1] != None:
+                if not west:
                     internalConnections.append(
                         (tile.getWestSidePorts(), x, y))
         return internalConnections
@@ -21,7 +21,9 @@ import math
 import os
 import string
 import csv
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
 import logging
 
 
@@ -29,7 +31,7 @@ from fasm import *  # Remove this line if you do not have the fasm library insta
 
 
 from fabric_generator.file_parser import parseMatrix, parseConfigMem, parseList
-from fabric_generator.fabric import IO, Direction, MultiplexerStyle, ConfigBitMode
+from fabric_generator.fabric import IO, Direction, Side, MultiplexerStyle, ConfigBitMode
 from fabric_generator.fabric import Fabric, Tile, Port, SuperTile, ConfigMem
 from fabric_generator.code_generation_VHDL import VHDLWriter
 from fabric_generator.code_generator import codeGenerator
@@ -38,6 +40,78 @@ SWITCH_MATRIX_DEBUG_SIGNAL = True
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _muxTemplate(multiplexerStyle: MultiplexerStyle, muxSize: int) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Build the component name and the port map template of a switch matrix multiplexer. The template only depends
+    on the multiplexer style and size, so it is built once per combination and the signal names are filled in with
+    `str.format_map` using `portName` and `pos` (the configuration bitstream position).
+
+    Args:
+        multiplexerStyle (MultiplexerStyle): The multiplexer style of the fabric
+        muxSize (int): The number of inputs of the multiplexer
+
+    Returns:
+        Tuple[str, Tuple[Tuple[str, str], ...]]: The multiplexer component name and the (port, signal template) pairs
+    """
+    numGnd = 0
+    muxComponentName = ""
+    if (multiplexerStyle == MultiplexerStyle.CUSTOM) and (muxSize == 2):
+        muxComponentName = 'my_mux2'
+    elif (multiplexerStyle == MultiplexerStyle.CUSTOM) and (2 < muxSize <= 4):
+        muxComponentName = 'cus_mux41_buf'
+        numGnd = 4-muxSize
+    elif (multiplexerStyle == MultiplexerStyle.CUSTOM) and (4 < muxSize <= 8):
+        muxComponentName = 'cus_mux81_buf'
+        numGnd = 8-muxSize
+    elif (multiplexerStyle == MultiplexerStyle.CUSTOM) and (8 < muxSize <= 16):
+        muxComponentName = 'cus_mux161_buf'
+        numGnd = 16-muxSize
+
+    portsPairs = []
+    start = 0
+    for start in range(muxSize):
+        portsPairs.append((f"A{start}", f"{{portName}}_input[{start}]"))
+
+    for end in range(start, numGnd):
+        portsPairs.append((f"A{end}", "GND0"))
+
+    if multiplexerStyle == MultiplexerStyle.CUSTOM:
+        if muxSize == 2:
+            portsPairs.append(("S", "ConfigBits[{pos}+0]"))
+        else:
+            for i in range(muxSize.bit_length()-1):
+                portsPairs.append((f"S{i}", f"ConfigBits[{{pos}}+{i}]"))
+                portsPairs.append((f"S{i}N", f"ConfigBits_N[{{pos}}+{i}]"))
+
+    portsPairs.append(("X", "{portName}"))
+    return muxComponentName, tuple(portsPairs)
+
+
+def _directionalPorts(tiles: Iterable[Tile]) -> Dict[str, Dict[IO, Dict[Direction, List[Port]]]]:
+    """
+    Filter the north, east, south and west ports of the given tiles once per tile type. The port lists only depend
+    on the tile type, so the generators can look them up for every tile location instead of filtering `portsInfo`
+    again.
+
+    Args:
+        tiles (Iterable[Tile]): The tiles to collect the ports from. `None` entries are skipped.
+
+    Returns:
+        Dict[str, Dict[IO, Dict[Direction, List[Port]]]]: The ports indexed by tile name, IO and wire direction
+    """
+    ports = {}
+    for t in tiles:
+        if t is None or t.name in ports:
+            continue
+        ports[t.name] = {io: {Direction.NORTH: t.getNorthPorts(io),
+                              Direction.EAST: t.getEastPorts(io),
+                              Direction.SOUTH: t.getSouthPorts(io),
+                              Direction.WEST: t.getWestPorts(io)}
+                         for io in (IO.INPUT, IO.OUTPUT)}
+    return ports
+
+
 class FabricGenerator:
     """
     This class contains all the function require to generate a fabric from csv files
@@ -87,7 +161,7 @@ class FabricGenerator:
             for b in tile.bels:
                 for p in b.inputs:
                     sourceName.append(f"{p}")
-                for p in b.outputs + b.externalOutput:
+                for p in chain(b.outputs, b.externalOutput):
                     destName.append(f"{p}")
 
             # jump wire
@@ -166,25 +240,16 @@ class FabricGenerator:
             matrix[s_index][d_index] = 1
 
         # writing the matrix back to the given out file
+        # the rows are built in memory and written out with a single write
+        lines = [file[0]]
+        for i in range(len(source)):
+            row = ",".join(str(matrix[i][j]) for j in range(len(destination)))
+            lines.append(f"{source[i]},{row},#,{matrix[i].count(1)}")
+        colCount = [str(sum(matrix[i][j] == 1 for i in range(rows)))
+                    for j in range(col)]
+        lines.append(f"#,{','.join(colCount)}")
         with open(OutFileName, "w") as f:
-            f.write(file[0] + "\n")
-            for i in range(len(source)):
-                f.write(f"{source[i]},")
-                for j in range(len(destination)):
-                    f.write(str(matrix[i][j]))
-                    if j != len(destination) - 1:
-                        f.write(',')
-                    else:
-                        f.write(f",#,{matrix[i].count(1)}")
-                f.write('\n')
-            colCount = []
-            for j in range(col):
-                count = 0
-                for i in range(rows):
-                    if matrix[i][j] == 1:
-                        count += 1
-                colCount.append(str(count))
-            f.write(f"#,{','.join(colCount)}")
+            f.write("\n".join(lines))
 
     @staticmethod
     def CSV2list(InFileName: str, OutFileName: str) -> None:
@@ -196,23 +261,22 @@ class FabricGenerator:
             OutFileName (str): The directory of the list file to be written
         """
         InFile = [i.strip('\n').split(',') for i in open(InFileName)]
+        # get the number of tiles in vertical direction
+        rows = len(InFile)
+        # get the number of tiles in horizontal direction
+        cols = len(InFile[0])
+        # top-left should be the name, the lines are collected and written out once
+        lines = [f"# {InFile[0][0]}"]
+        # switch matrix inputs
+        inputs = InFile[0][1:]
+        # beginning from the second line, write out the list
+        for line in InFile[1:]:
+            for i in range(1, cols):
+                if line[i] != '0':
+                    # it is [i-1] because the beginning of the line is the destination port
+                    lines.append(f"{line[0]},{inputs[i-1]}")
         with open(OutFileName, "w") as f:
-            # get the number of tiles in vertical direction
-            rows = len(InFile)
-            # get the number of tiles in horizontal direction
-            cols = len(InFile[0])
-            # top-left should be the name
-            print('#', InFile[0][0], file=f)
-            # switch matrix inputs
-            inputs = []
-            for item in InFile[0][1:]:
-                inputs.append(item)
-            # beginning from the second line, write out the list
-            for line in InFile[1:]:
-                for i in range(1, cols):
-                    if line[i] != '0':
-                        # it is [i-1] because the beginning of the line is the destination port
-                        print(line[0]+','+inputs[i-1], file=f)
+            f.write("\n".join(lines) + "\n")
         return
 
     def generateConfigMemInit(self, file: str, globalConfigBitsCounter: int) -> None:
@@ -340,18 +404,19 @@ class FabricGenerator:
         self.writer.addNewLine()
         self.writer.addComment("instantiate frame latches", end="")
         for i in configMemList:
-            counter = 0
-            for k in range(self.fabric.frameBitsPerRow):
-                if i.usedBitMask[k] == "1":
-                    self.writer.addInstantiation(compName="LHQD1",
-                                                 compInsName=f"Inst_{i.frameName}_bit{self.fabric.frameBitsPerRow-1-k}",
-                                                 portsPairs=[("D", f"FrameData[{self.fabric.frameBitsPerRow-1-k}]"),
-                                                             ("E",
-                                                              f"FrameStrobe[{i.frameIndex}]"),
-                                                             ("Q", f"ConfigBits[{i.configBitRanges[counter]}]"),
-                                                             ("QN", f"ConfigBits_N[{i.configBitRanges[counter]}]")]
-                                                 )
-                    counter += 1
+            # the n-th used bit of the frame drives the n-th config bit of the frame
+            usedBits = [k for k in range(self.fabric.frameBitsPerRow)
+                        if i.usedBitMask[k] == "1"]
+            for n, k in enumerate(usedBits):
+                configBit = i.configBitRanges[n]
+                self.writer.addInstantiation(compName="LHQD1",
+                                             compInsName=f"Inst_{i.frameName}_bit{self.fabric.frameBitsPerRow-1-k}",
+                                             portsPairs=[("D", f"FrameData[{self.fabric.frameBitsPerRow-1-k}]"),
+                                                         ("E",
+                                                          f"FrameStrobe[{i.frameIndex}]"),
+                                                         ("Q", f"ConfigBits[{configBit}]"),
+                                                         ("QN", f"ConfigBits_N[{configBit}]")]
+                                             )
 
         self.writer.addDesignDescriptionEnd()
         self.writer.writeToFile()
@@ -557,41 +622,11 @@ class FabricGenerator:
                 old_ConfigBitstreamPosition = configBitstreamPosition
                 # len(connections[portName]).bit_length()-1 tells us how many configuration bits a multiplexer takes
 
-                numGnd = 0
-                muxComponentName = ""
-                if (self.fabric.multiplexerStyle == MultiplexerStyle.CUSTOM) and (muxSize == 2):
-                    muxComponentName = 'my_mux2'
-                elif (self.fabric.multiplexerStyle == MultiplexerStyle.CUSTOM) and (2 < muxSize <= 4):
-                    muxComponentName = 'cus_mux41_buf'
-                    numGnd = 4-muxSize
-                elif (self.fabric.multiplexerStyle == MultiplexerStyle.CUSTOM) and (4 < muxSize <= 8):
-                    muxComponentName = 'cus_mux81_buf'
-                    numGnd = 8-muxSize
-                elif (self.fabric.multiplexerStyle == MultiplexerStyle.CUSTOM) and (8 < muxSize <= 16):
-                    muxComponentName = 'cus_mux161_buf'
-                    numGnd = 16-muxSize
-
-                portsPairs = []
-                start = 0
-                for start in range(muxSize):
-                    portsPairs.append(
-                        (f"A{start}", f"{portName}_input[{start}]"))
-
-                for end in range(start, numGnd):
-                    portsPairs.append((f"A{end}", "GND0"))
-
-                if self.fabric.multiplexerStyle == MultiplexerStyle.CUSTOM:
-                    if muxSize == 2:
-                        portsPairs.append(
-                            ("S", f"ConfigBits[{configBitstreamPosition}+0]"))
-                    else:
-                        for i in range(muxSize.bit_length()-1):
-                            portsPairs.append(
-                                (f"S{i}", f"ConfigBits[{configBitstreamPosition}+{i}]"))
-                            portsPairs.append(
-                                (f"S{i}N", f"ConfigBits_N[{configBitstreamPosition}+{i}]"))
-
-                portsPairs.append((f"X", f"{portName}"))
+                muxComponentName, template = _muxTemplate(
+                    self.fabric.multiplexerStyle, muxSize)
+                fields = {"portName": portName, "pos": configBitstreamPosition}
+                portsPairs = [(port, signal.format_map(fields))
+                              for port, signal in template]
 
                 if (self.fabric.multiplexerStyle == MultiplexerStyle.CUSTOM):
                     # we add the input signal in reversed order
@@ -667,8 +702,8 @@ class FabricGenerator:
         self.writer.addPortStart(indentLevel=1)
 
         # holder for each direction of port string
-        portList = [tile.getNorthSidePorts(), tile.getEastSidePorts(),
-                    tile.getWestSidePorts(), tile.getSouthSidePorts()]
+        portList = [tile.portsBySide[Side.NORTH], tile.portsBySide[Side.EAST],
+                    tile.portsBySide[Side.WEST], tile.portsBySide[Side.SOUTH]]
         for l in portList:
             if not l:
                 continue
@@ -704,22 +739,21 @@ class FabricGenerator:
         self.writer.addPortScalar("UserCLKo", IO.OUTPUT, indentLevel=2)
 
         if self.fabric.configBitMode == ConfigBitMode.FRAME_BASED:
-            if tile.globalConfigBits > 0:
+            # every tile passes the frame strobe on, only tiles with config bits also take the frame data
+            # and flag the config ports
+            hasConfigBits = tile.globalConfigBits > 0
+            if hasConfigBits:
                 self.writer.addPortVector(
                     "FrameData", IO.INPUT, "FrameBitsPerRow -1", indentLevel=2)
                 self.writer.addComment("CONFIG_PORT", onNewLine=False, end="")
                 self.writer.addPortVector("FrameData_O", IO.OUTPUT,
                                           "FrameBitsPerRow -1", indentLevel=2)
-                self.writer.addPortVector("FrameStrobe", IO.INPUT,
-                                          "MaxFramesPerCol -1", indentLevel=2)
+            self.writer.addPortVector("FrameStrobe", IO.INPUT,
+                                      "MaxFramesPerCol -1", indentLevel=2)
+            if hasConfigBits:
                 self.writer.addComment("CONFIG_PORT", onNewLine=False, end="")
-                self.writer.addPortVector("FrameStrobe_O", IO.OUTPUT,
-                                          "MaxFramesPerCol -1", indentLevel=2)
-            else:
-                self.writer.addPortVector("FrameStrobe", IO.INPUT,
-                                          "MaxFramesPerCol -1", indentLevel=2)
-                self.writer.addPortVector("FrameStrobe_O", IO.OUTPUT,
-                                          "MaxFramesPerCol -1", indentLevel=2)
+            self.writer.addPortVector("FrameStrobe_O", IO.OUTPUT,
+                                      "MaxFramesPerCol -1", indentLevel=2)
 
         elif self.fabric.configBitMode == ConfigBitMode.FLIPFLOP_CHAIN:
             self.writer.addPortScalar("MODE", IO.INPUT, indentLevel=2)
@@ -736,10 +770,10 @@ class FabricGenerator:
         # insert CLB, I/O (or whatever BEL) component declaration
         # specified in the fabric csv file after the 'BEL' key word
         # we use this list to check if we have seen a BEL description before so we only insert one component declaration
-        BEL_VHDL_riles_processed = []
+        BEL_VHDL_riles_processed = set()
         for i in tile.bels:
             if i.src not in BEL_VHDL_riles_processed:
-                BEL_VHDL_riles_processed.append(i.src)
+                BEL_VHDL_riles_processed.add(i.src)
                 self.writer.addComponentDeclarationForFile(i.src)
 
         # insert switch matrix and config_mem component declaration
@@ -773,22 +807,21 @@ class FabricGenerator:
         self.writer.addComment("signal declarations", onNewLine=True)
         # BEL port wires
         self.writer.addComment("BEL ports (e.g., slices)", onNewLine=True)
-        repeatDeclaration = set()
-        for bel in tile.bels:
-            for i in bel.inputs + bel.outputs:
-                if f"{i}" not in repeatDeclaration:
-                    self.writer.addConnectionScalar(i)
-                    repeatDeclaration.add(f"{bel.prefix}{i}")
+        # BEL port names already carry the BEL prefix, so a name is only declared once
+        belSignals = dict.fromkeys(
+            i for bel in tile.bels for i in chain(bel.inputs, bel.outputs))
+        for i in belSignals:
+            self.writer.addConnectionScalar(i)
 
         # Jump wires
         self.writer.addComment("Jump wires", onNewLine=True)
-        for p in tile.portsInfo:
-            if p.wireDirection == Direction.JUMP:
-                if p.sourceName != "NULL" and p.destinationName != "NULL" and p.inOut == IO.OUTPUT:
-                    self.writer.addConnectionVector(p.name, f"{p.wireCount}-1")
+        jumpPorts = tile.portsByDirection[Direction.JUMP]
+        for p in jumpPorts:
+            if p.sourceName != "NULL" and p.destinationName != "NULL" and p.inOut == IO.OUTPUT:
+                self.writer.addConnectionVector(p.name, f"{p.wireCount}-1")
 
-                for k in range(p.wireCount):
-                    allJumpWireList.append(f"{p.name}( {k} )")
+            for k in range(p.wireCount):
+                allJumpWireList.append(f"{p.name}( {k} )")
 
         # internal configuration data signal to daisy-chain all BELs (if any and in the order they are listed in the fabric.csv)
         self.writer.addComment(
@@ -818,18 +851,22 @@ class FabricGenerator:
         self.writer.addConnectionVector(
             "FrameStrobe_O_i", "MaxFramesPerCol-1", 0)
 
-        added = set()
+        # wires spanning two or more tiles are buffered, collect them once with their high bound index
+        # and skip repeated source/destination pairs
+        longPorts: Dict[Tuple[str, str], Tuple[Port, int]] = {}
         for port in tile.portsInfo:
             span = abs(port.xOffset) + abs(port.yOffset)
-            if (port.sourceName, port.destinationName) in added:
+            if (port.sourceName, port.destinationName) in longPorts:
                 continue
             if span >= 2 and port.sourceName != "NULL" and port.destinationName != "NULL":
-                highBoundIndex = span*port.wireCount - 1
-                self.writer.addConnectionVector(
-                    f"{port.destinationName}_i", highBoundIndex)
-                self.writer.addConnectionVector(
-                    f"{port.sourceName}_i", highBoundIndex - port.wireCount)
-                added.add((port.sourceName, port.destinationName))
+                longPorts[(port.sourceName, port.destinationName)] = (
+                    port, span*port.wireCount - 1)
+
+        for port, highBoundIndex in longPorts.values():
+            self.writer.addConnectionVector(
+                f"{port.destinationName}_i", highBoundIndex)
+            self.writer.addConnectionVector(
+                f"{port.sourceName}_i", highBoundIndex - port.wireCount)
 
         self.writer.addNewLine()
         self.writer.addLogicStart()
@@ -837,56 +874,32 @@ class FabricGenerator:
         if tile.globalConfigBits > 0:
             self.writer.addAssignScalar("FrameData_O_i", "FrameData_i")
             self.writer.addNewLine()
-            for i in range(self.fabric.frameBitsPerRow):
-                self.writer.addInstantiation("my_buf",
-                                             f"data_inbuf_{i}",
-                                             portsPairs=[("A", f"FrameData[{i}]"),
-                                                         ("X", f"FrameData_i[{i}]")])
-            for i in range(self.fabric.frameBitsPerRow):
-                self.writer.addInstantiation("my_buf",
-                                             f"data_outbuf_{i}",
-                                             portsPairs=[("A", f"FrameData_O_i[{i}]"),
-                                                         ("X", f"FrameData_O[{i}]")])
+            self.writer.addBufferArray("my_buf", "data_inbuf", "FrameData",
+                                       "FrameData_i", self.fabric.frameBitsPerRow)
+            self.writer.addBufferArray("my_buf", "data_outbuf", "FrameData_O_i",
+                                       "FrameData_O", self.fabric.frameBitsPerRow)
 
         # strobe is always added even when config bits are 0
         self.writer.addAssignScalar("FrameStrobe_O_i", "FrameStrobe_i")
         self.writer.addNewLine()
-        for i in range(self.fabric.maxFramesPerCol):
-            self.writer.addInstantiation("my_buf",
-                                         f"strobe_inbuf_{i}",
-                                         portsPairs=[("A", f"FrameStrobe[{i}]"),
-                                                     ("X", f"FrameStrobe_i[{i}]")])
-
-        for i in range(self.fabric.maxFramesPerCol):
-            self.writer.addInstantiation("my_buf",
-                                         f"strobe_outbuf_{i}",
-                                         portsPairs=[("A", f"FrameStrobe_O_i[{i}]"),
-                                                     ("X", f"FrameStrobe_O[{i}]")])
-
-        added = set()
-        for port in tile.portsInfo:
-            span = abs(port.xOffset) + abs(port.yOffset)
-            if (port.sourceName, port.destinationName) in added:
-                continue
-            if span >= 2 and port.sourceName != "NULL" and port.destinationName != "NULL":
-                highBoundIndex = span*port.wireCount - 1
-                # using scalar assignment to connect the two vectors
-                # could replace with assign as vector, but will lose the - wireCount readability
-                self.writer.addAssignScalar(
-                    f"{port.sourceName}_i[{highBoundIndex}-{port.wireCount}:0]", f"{port.destinationName}_i[{highBoundIndex}:{port.wireCount}]")
-                self.writer.addNewLine()
-                for i in range(highBoundIndex - port.wireCount + 1):
-                    self.writer.addInstantiation("my_buf",
-                                                 f"{port.destinationName}_inbuf_{i}",
-                                                 portsPairs=[("A", f"{port.destinationName}[{i+port.wireCount}]"),
-                                                             ("X", f"{port.destinationName}_i[{i+port.wireCount}]")])
-                for i in range(highBoundIndex - port.wireCount + 1):
-                    self.writer.addInstantiation("my_buf",
-                                                 f"{port.sourceName}_outbuf_{i}",
-                                                 portsPairs=[("A", f"{port.sourceName}_i[{i}]"),
-                                                             ("X", f"{port.sourceName}[{i}]")])
-
-                added.add((port.sourceName, port.destinationName))
+        self.writer.addBufferArray("my_buf", "strobe_inbuf", "FrameStrobe",
+                                   "FrameStrobe_i", self.fabric.maxFramesPerCol)
+        self.writer.addBufferArray("my_buf", "strobe_outbuf", "FrameStrobe_O_i",
+                                   "FrameStrobe_O", self.fabric.maxFramesPerCol)
+
+        for port, highBoundIndex in longPorts.values():
+            wireCount = port.wireCount
+            sourceName = port.sourceName
+            destinationName = port.destinationName
+            # using scalar assignment to connect the two vectors
+            # could replace with assign as vector, but will lose the - wireCount readability
+            self.writer.addAssignScalar(
+                f"{sourceName}_i[{highBoundIndex}-{wireCount}:0]", f"{destinationName}_i[{highBoundIndex}:{wireCount}]")
+            self.writer.addNewLine()
+            self.writer.addBufferArray("my_buf", f"{destinationName}_inbuf", destinationName,
+                                       f"{destinationName}_i", highBoundIndex - wireCount + 1, offset=wireCount)
+            self.writer.addBufferArray("my_buf", f"{sourceName}_outbuf", f"{sourceName}_i",
+                                       sourceName, highBoundIndex - wireCount + 1)
 
         self.writer.addInstantiation("clk_buf",
                                      f"inst_clk_buf",
@@ -926,12 +939,12 @@ class FabricGenerator:
             signal = []
 
             # internal port
-            for port in bel.inputs + bel.outputs:
+            for port in chain(bel.inputs, bel.outputs):
                 port = port.removeprefix(bel.prefix)
                 portsPairs.append((port, f"{bel.prefix}{port}"))
 
             # external port
-            for port in bel.externalInput + bel.externalOutput:
+            for port in chain(bel.externalInput, bel.externalOutput):
                 port = port.removeprefix(bel.prefix)
                 portsPairs.append((port, f"{bel.prefix}{port}"))
 
@@ -977,11 +990,12 @@ class FabricGenerator:
         # The switch matrix uses single bit ports (std_logic and not std_logic_vector)!!!
 
         portsPairs = []
+        normalPorts = [i for i in tile.portsInfo if i.wireDirection != Direction.JUMP]
         # normal input wire
-        for i in tile.portsInfo:
-            if i.wireDirection != Direction.JUMP and i.inOut == IO.INPUT:
-                portsPairs += list(zip(i.expandPortInfoByName(),
-                                   i.expandPortInfoByName(indexed=True)))
+        for i in normalPorts:
+            if i.inOut == IO.INPUT:
+                portsPairs.extend(zip(i.expandPortInfoByName(),
+                                      i.expandPortInfoByName(indexed=True)))
         # bel input wire (bel output is input to switch matrix)
         for bel in tile.bels:
             for p in bel.outputs:
@@ -989,19 +1003,19 @@ class FabricGenerator:
 
         # jump input wire
         port, signal = [], []
-        for i in tile.portsInfo:
-            if i.wireDirection == Direction.JUMP and i.inOut == IO.INPUT:
+        for i in jumpPorts:
+            if i.inOut == IO.INPUT:
                 port += i.expandPortInfoByName()
-            if i.wireDirection == Direction.JUMP and i.inOut == IO.OUTPUT:
+            if i.inOut == IO.OUTPUT:
                 signal += i.expandPortInfoByName(indexed=True)
 
-        portsPairs += list(zip(port, signal))
+        portsPairs.extend(zip(port, signal))
 
         # normal output wire
-        for i in tile.portsInfo:
-            if i.wireDirection != Direction.JUMP and i.inOut == IO.OUTPUT:
-                portsPairs += list(zip(i.expandPortInfoByName(),
-                                   i.expandPortInfoByNameTop(indexed=True)))
+        for i in normalPorts:
+            if i.inOut == IO.OUTPUT:
+                portsPairs.extend(zip(i.expandPortInfoByName(),
+                                      i.expandPortInfoByNameTop(indexed=True)))
 
         # bel output wire (bel input is input to switch matrix)
         for bel in tile.bels:
@@ -1010,13 +1024,12 @@ class FabricGenerator:
 
         # jump output wire
         port, signal = [], []
-        for i in tile.portsInfo:
-            if i.wireDirection == Direction.JUMP and i.inOut == IO.OUTPUT:
+        for i in jumpPorts:
+            if i.inOut == IO.OUTPUT:
                 port += i.expandPortInfoByName()
-            if i.wireDirection == Direction.JUMP and i.inOut == IO.OUTPUT:
                 signal += i.expandPortInfoByName(indexed=True)
 
-        portsPairs += list(zip(port, signal))
+        portsPairs.extend(zip(port, signal))
 
         if self.fabric.configBitMode == ConfigBitMode.FLIPFLOP_CHAIN:
             portsPairs.append(("MODE", "Mode"))
@@ -1057,19 +1070,23 @@ class FabricGenerator:
         self.writer.addParameterEnd(indentLevel=1)
         self.writer.addPortStart(indentLevel=1)
 
+        # for every location of the tile map whether there is no tile to the (north, east, south, west)
+        boundary = superTile.tileBoundaries
+
         portsAround = superTile.getPortsAroundTile()
 
         for k, v in portsAround.items():
             if not v:
                 continue
             x, y = k.split(",")
+            prefix = f"Tile_X{x}Y{y}_"
             for pList in v:
                 self.writer.addComment(
-                    f"Tile_X{x}Y{y}_{pList[0].wireDirection}", onNewLine=True, indentLevel=1)
+                    f"{prefix}{pList[0].wireDirection}", onNewLine=True, indentLevel=1)
                 for p in pList:
                     wire = (abs(p.xOffset) + abs(p.yOffset)) * p.wireCount - 1
                     self.writer.addPortVector(
-                        f"Tile_X{x}Y{y}_{p.name}", p.inOut, wire, indentLevel=2)
+                        f"{prefix}{p.name}", p.inOut, wire, indentLevel=2)
                     self.writer.addComment(str(p), onNewLine=False)
 
         # add tile external bel port
@@ -1092,19 +1109,19 @@ class FabricGenerator:
         if self.fabric.configBitMode == ConfigBitMode.FRAME_BASED:
             for y, row in enumerate(superTile.tileMap):
                 for x, tile in enumerate(row):
-                    if y - 1 < 0 or superTile.tileMap[y-1][x] == None:
+                    if boundary[y][x][0]:
                         self.writer.addPortVector(
                             f"Tile_X{x}Y{y}_FrameStrobe_O", IO.OUTPUT, "MaxFramesPerCol-1", indentLevel=2)
                         self.writer.addComment("CONFIG_PORT", onNewLine=False)
-                    if x - 1 < 0 or superTile.tileMap[y][x-1] == None:
+                    if boundary[y][x][3]:
                         self.writer.addPortVector(
                             f"Tile_X{x}Y{y}_FrameData", IO.INPUT, "FrameBitsPerRow-1", indentLevel=2)
                         self.writer.addComment("CONFIG_PORT", onNewLine=False)
-                    if y + 1 >= len(superTile.tileMap) or superTile.tileMap[y+1][x] == None:
+                    if boundary[y][x][2]:
                         self.writer.addPortVector(
                             f"Tile_X{x}Y{y}_FrameStrobe", IO.INPUT, "MaxFramesPerCol-1", indentLevel=2)
                         self.writer.addComment("CONFIG_PORT", onNewLine=False)
-                    if x + 1 >= len(superTile.tileMap[y]) or superTile.tileMap[y][x+1] == None:
+                    if boundary[y][x][1]:
                         self.writer.addPortVector(
                             f"Tile_X{x}Y{y}_FrameData_O", IO.OUTPUT, "FrameBitsPerRow-1", indentLevel=2)
                         self.writer.addComment("CONFIG_PORT", onNewLine=False)
@@ -1127,25 +1144,26 @@ class FabricGenerator:
         self.writer.addComment("signal declarations", onNewLine=True)
         for i, x, y in internalConnections:
             if i:
+                prefix = f"Tile_X{x}Y{y}_"
                 self.writer.addComment(
-                    f"Tile_X{x}Y{y}_{i[0].wireDirection}", onNewLine=True)
+                    f"{prefix}{i[0].wireDirection}", onNewLine=True)
                 for p in i:
                     if p.inOut == IO.OUTPUT:
                         wire = (abs(p.xOffset) + abs(p.yOffset)) * \
                             p.wireCount - 1
                         self.writer.addConnectionVector(
-                            f"Tile_X{x}Y{y}_{p.name}", wire, indentLevel=1)
+                            f"{prefix}{p.name}", wire, indentLevel=1)
                         self.writer.addComment(str(p), onNewLine=False)
 
         # declare internal connections for frameData, frameStrobe, and UserCLK
         for y, row in enumerate(superTile.tileMap):
             for x, tile in enumerate(row):
-                if 0 <= y - 1 < len(superTile.tileMap) and superTile.tileMap[y-1][x] != None:
+                if not boundary[y][x][0]:
                     self.writer.addConnectionVector(
                         f"Tile_X{x}Y{y}_FrameStrobe_O", "MaxFramesPerCol-1", indentLevel=1)
                     self.writer.addConnectionScalar(
                         f"Tile_X{x}Y{y}_userCLKo", indentLevel=1)
-                if 0 <= x - 1 < len(superTile.tileMap[y]) and superTile.tileMap[y][x-1] != None:
+                if not boundary[y][x][3]:
                     self.writer.addConnectionVector(
                         f"Tile_X{x}Y{y}_FrameData_O", "FrameBitsPerRow-1", indentLevel=1)
 
@@ -1156,62 +1174,38 @@ class FabricGenerator:
         self.writer.addLogicStart()
 
         # pair up the connection for tile instantiation
+        tilePorts = _directionalPorts(superTile.tiles)
         for y, row in enumerate(superTile.tileMap):
             for x, tile in enumerate(row):
-                northInput, southInput, eastInput, westInput = [], [], [], []
                 outputSignalList = []
                 portsPairs = []
-                if tile == None:
+                if tile is None:
                     continue
+                inputPorts = tilePorts[tile.name][IO.INPUT]
+                outputPorts = tilePorts[tile.name][IO.OUTPUT]
+                prefix = f"Tile_X{x}Y{y}_"
+
+                # the tile driving each side as (side, boundary index, neighbour x, neighbour y):
+                # north side of the south tile, east side of the west tile,
+                # south side of the north tile and west side of the east tile
+                # without a neighbour inside the super tile the input is connected to the tile's own port
+                neighbours = ((Direction.NORTH, 2, x, y+1),
+                              (Direction.EAST, 3, x-1, y),
+                              (Direction.SOUTH, 0, x, y-1),
+                              (Direction.WEST, 1, x+1, y))
+                for direction, side, nx, ny in neighbours:
+                    if not boundary[y][x][side]:
+                        inputPrefix = f"Tile_X{nx}Y{ny}_"
+                        inputs = tilePorts[superTile.tileMap[ny][nx].name][IO.OUTPUT][direction]
+                    else:
+                        inputPrefix = prefix
+                        inputs = inputPorts[direction]
+                    portsPairs.extend((port.name, inputPrefix + signal.name)
+                                      for port, signal in zip(inputPorts[direction], inputs))
 
-                # north direction input connection
-                northPort = [i.name for i in tile.getNorthPorts(IO.INPUT)]
-                if 0 <= y + 1 < len(superTile.tileMap) and superTile.tileMap[y+1][x] != None:
-                    for p in superTile.tileMap[y+1][x].getNorthPorts(IO.OUTPUT):
-                        northInput.append(f"Tile_X{x}Y{y+1}_{p.name}")
-                else:
-                    for p in tile.getNorthPorts(IO.INPUT):
-                        northInput.append(f"Tile_X{x}Y{y}_{p.name}")
-
-                portsPairs += list(zip(northPort, northInput))
-                # east direction input connection
-                eastPort = [i.name for i in tile.getEastPorts(IO.INPUT)]
-                if 0 <= x - 1 < len(superTile.tileMap[0]) and superTile.tileMap[y][x-1] != None:
-                    for p in superTile.tileMap[y][x-1].getEastPorts(IO.OUTPUT):
-                        eastInput.append(f"Tile_X{x-1}Y{y}_{p.name}")
-                else:
-                    for p in tile.getEastPorts(IO.INPUT):
-                        eastInput.append(f"Tile_X{x}Y{y}_{p.name}")
-
-                portsPairs += list(zip(eastPort, eastInput))
-
-                # south direction input connection
-                southPort = [i.name for i in tile.getSouthPorts(IO.INPUT)
-                             if i.inOut == IO.INPUT]
-                if 0 <= y - 1 < len(superTile.tileMap) and superTile.tileMap[y-1][x] != None:
-                    for p in superTile.tileMap[y-1][x].getSouthPorts(IO.OUTPUT):
-                        southInput.append(f"Tile_X{x}Y{y-1}_{p.name}")
-                else:
-                    for p in tile.getSouthPorts(IO.INPUT):
-                        southInput.append(f"Tile_X{x}Y{y}_{p.name}")
-
-                portsPairs += list(zip(southPort, southInput))
-
-                # west direction input connection
-                westPort = [i.name for i in tile.getWestPorts(IO.INPUT)
-                            if i.inOut == IO.INPUT]
-                if 0 <= x + 1 < len(superTile.tileMap[0]) and superTile.tileMap[y][x+1] != None:
-                    for p in superTile.tileMap[y][x+1].getWestPorts(IO.OUTPUT):
-                        westInput.append(f"Tile_X{x+1}Y{y}_{p.name}")
-                else:
-                    for p in tile.getWestPorts(IO.INPUT):
-                        westInput.append(f"Tile_X{x}Y{y}_{p.name}")
-
-                portsPairs += list(zip(westPort, westInput))
-
-                for p in tile.getNorthPorts(IO.OUTPUT) + tile.getEastPorts(IO.OUTPUT) + tile.getSouthPorts(IO.OUTPUT) + tile.getWestPorts(IO.OUTPUT):
-                    portsPairs.append(
-                        (p.name, f"Tile_X{x}Y{y}_{p.name}"))
+                portsPairs.extend((p.name, prefix + p.name) for d in
+                                  (Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST)
+                                  for p in outputPorts[d])
 
                 # add clock to tile
                 portsPairs.append(("UserCLK", "userCLK"))
@@ -1219,7 +1213,7 @@ class FabricGenerator:
 
                 if self.fabric.configBitMode == ConfigBitMode.FRAME_BASED:
                     # add connection for frameData, frameStrobe and UserCLK
-                    if 0 <= x - 1 < len(superTile.tileMap[0]) and superTile.tileMap[y][x-1] != None:
+                    if not boundary[y][x][3]:
                         portsPairs.append(
                             ("FrameData", f"Tile_X{x-1}Y{y}_FrameData_O"))
                     else:
@@ -1229,7 +1223,7 @@ class FabricGenerator:
                     portsPairs.append(
                         ("FrameData_O", f"Tile_X{x}Y{y}_FrameData_O"))
 
-                    if 0 <= y + 1 < len(superTile.tileMap) and superTile.tileMap[y+1][x] != None:
+                    if not boundary[y][x][2]:
                         portsPairs.append(
                             ("FrameStrobe", f"Tile_X{x}Y{y+1}_FrameStrobe_O"))
                     else:
@@ -1270,18 +1264,41 @@ class FabricGenerator:
                                  0, indentLevel=2)
         self.writer.addParameterEnd(indentLevel=1)
         self.writer.addPortStart(indentLevel=1)
-        for y, row in enumerate(self.fabric.tile):
-            for x, tile in enumerate(row):
-                if tile != None:
-                    for bel in tile.bels:
-                        for i in bel.externalInput:
-                            self.writer.addPortScalar(
-                                f"Tile_X{x}Y{y}_{i}", IO.INPUT, indentLevel=2)
-                            self.writer.addComment("EXTERNAL", onNewLine=False)
-                        for i in bel.externalOutput:
-                            self.writer.addPortScalar(
-                                f"Tile_X{x}Y{y}_{i}", IO.OUTPUT, indentLevel=2)
-                            self.writer.addComment("EXTERNAL", onNewLine=False)
+        fabricHeight = len(self.fabric.tile)
+        fabricWidth = len(self.fabric.tile[0])
+
+        def tileAt(x: int, y: int) -> Optional[Tile]:
+            # the tile at a fabric location, None for empty cells and for locations outside of the fabric
+            if 0 <= y < fabricHeight and 0 <= x < fabricWidth:
+                return self.fabric.tile[y][x]
+            return None
+
+        # the locations holding a tile, in row-major order, so the passes below do not need to skip empty cells
+        occupiedTiles = [(x, y, tile) for y, row in enumerate(self.fabric.tile)
+                         for x, tile in enumerate(row) if tile is not None]
+        # the port tables below only depend on the tile type, so each is built for the first tile of a type and
+        # looked up by tile name for the others
+        # the BEL ports routed to the top-level as (port name, direction, True for external or False for shared ports)
+        belTopPorts: Dict[str, List[Tuple[str, IO, bool]]] = {}
+        for x, y, tile in occupiedTiles:
+            if tile.name in belTopPorts:
+                continue
+            belTopPorts[tile.name] = []
+            for b in tile.bels:
+                for p in b.externalInput:
+                    belTopPorts[tile.name].append((p, IO.INPUT, True))
+                for p in b.externalOutput:
+                    belTopPorts[tile.name].append((p, IO.OUTPUT, True))
+                for p, io in b.sharedPort:
+                    if "UserCLK" not in p:
+                        belTopPorts[tile.name].append((p, io, False))
+
+        for x, y, tile in occupiedTiles:
+            prefix = f"Tile_X{x}Y{y}_"
+            for p, io, external in belTopPorts[tile.name]:
+                if external:
+                    self.writer.addPortScalar(prefix + p, io, indentLevel=2)
+                    self.writer.addComment("EXTERNAL", onNewLine=False)
 
         if self.fabric.configBitMode == ConfigBitMode.FRAME_BASED:
             self.writer.addPortVector(
@@ -1324,52 +1341,54 @@ class FabricGenerator:
                                onNewLine=True, end="\n")
 
         if self.fabric.configBitMode == 'FlipFlopChain':
-            tileCounter = 0
-            for row in self.fabric.tile:
-                for t in row:
-                    if t != None:
-                        tileCounter += 1
-            self.writer.addConnectionVector("conf_data", tileCounter)
+            self.writer.addConnectionVector("conf_data", len(occupiedTiles))
 
         if self.fabric.configBitMode == ConfigBitMode.FRAME_BASED:
+            # the frame signal names are used by the declarations and again by the instances around every tile, so
+            # they are built once and looked up by row and column
+            rowFrameData = [f"Tile_Y{y}_FrameData" for y in range(self.fabric.numberOfRows)]
+            columnFrameStrobe = [f"Tile_X{x}_FrameStrobe" for x in range(self.fabric.numberOfColumns)]
+            frameDataOut = [[f"Tile_X{x}Y{y}_FrameData_O" for x in range(self.fabric.numberOfColumns)]
+                            for y in range(self.fabric.numberOfRows)]
+            frameStrobeOut = [[f"Tile_X{x}Y{y}_FrameStrobe_O" for x in range(self.fabric.numberOfColumns)]
+                              for y in range(self.fabric.numberOfRows+1)]
+
             # FrameData       =>     Tile_Y3_FrameData,
             # FrameStrobe      =>     Tile_X1_FrameStrobe
             # MaxFramesPerCol : integer := 20;
             # FrameBitsPerRow : integer := 32;
-            for y in range(self.fabric.numberOfRows):
-                self.writer.addConnectionVector(
-                    f"Tile_Y{y}_FrameData", "FrameBitsPerRow -1")
+            for name in rowFrameData:
+                self.writer.addConnectionVector(name, "FrameBitsPerRow -1")
 
-            for x in range(self.fabric.numberOfColumns):
-                self.writer.addConnectionVector(
-                    f"Tile_X{x}_FrameStrobe", "MaxFramesPerCol - 1")
+            for name in columnFrameStrobe:
+                self.writer.addConnectionVector(name, "MaxFramesPerCol - 1")
 
-            for y in range(self.fabric.numberOfRows):
-                for x in range(self.fabric.numberOfColumns):
-                    self.writer.addConnectionVector(
-                        f"Tile_X{x}Y{y}_FrameData_O", "FrameBitsPerRow - 1")
+            for row in frameDataOut:
+                for name in row:
+                    self.writer.addConnectionVector(name, "FrameBitsPerRow - 1")
 
-            for y in range(self.fabric.numberOfRows+1):
-                for x in range(self.fabric.numberOfColumns):
-                    self.writer.addConnectionVector(
-                        f"Tile_X{x}Y{y}_FrameStrobe_O", "MaxFramesPerCol - 1")
+            for row in frameStrobeOut:
+                for name in row:
+                    self.writer.addConnectionVector(name, "MaxFramesPerCol - 1")
 
         self.writer.addComment(
             "tile-to-tile signal declarations", onNewLine=True)
-        for y, row in enumerate(self.fabric.tile):
-            for x, tile in enumerate(row):
-                if tile != None:
-                    seenPorts = set()
-                    for p in tile.portsInfo:
-                        wireLength = (abs(p.xOffset)+abs(p.yOffset)
-                                      ) * p.wireCount-1
-                        if p.sourceName == "NULL" or p.wireDirection == Direction.JUMP:
-                            continue
-                        if p.sourceName in seenPorts:
-                            continue
-                        seenPorts.add(p.sourceName)
-                        self.writer.addConnectionVector(
-                            f"Tile_X{x}Y{y}_{p.sourceName}", wireLength)
+        # the wires leaving each tile type as (source port name, highest wire index)
+        tileWires: Dict[str, List[Tuple[str, int]]] = {}
+        for x, y, tile in occupiedTiles:
+            if tile.name not in tileWires:
+                seenPorts = {}
+                for p in tile.portsInfo:
+                    if p.sourceName == "NULL" or p.wireDirection == Direction.JUMP:
+                        continue
+                    if p.sourceName in seenPorts:
+                        continue
+                    seenPorts[p.sourceName] = (
+                        abs(p.xOffset)+abs(p.yOffset)) * p.wireCount-1
+                tileWires[tile.name] = list(seenPorts.items())
+            prefix = f"Tile_X{x}Y{y}_"
+            for sourceName, wireLength in tileWires[tile.name]:
+                self.writer.addConnectionVector(prefix + sourceName, wireLength)
         self.writer.addNewLine()
         # VHDL architecture body
         self.writer.addLogicStart()
@@ -1386,213 +1405,180 @@ class FabricGenerator:
             self.writer.addComment("CONFout is from tile entity")
 
         if self.fabric.configBitMode == ConfigBitMode.FRAME_BASED:
-            for y in range(1, len(self.fabric.tile)-1):
+            for y in range(1, fabricHeight-1):
                 self.writer.addAssignVector(
                     f"Tile_Y{y}_FrameData", "FrameData", f"FrameBitsPerRow*({y}+1)-1", f"FrameBitsPerRow*{y}")
-            for x in range(len(self.fabric.tile[0])):
+            for x in range(fabricWidth):
                 self.writer.addAssignVector(
                     f"Tile_X{x}_FrameStrobe", "FrameStrobe", f"MaxFramesPerCol*({x}+1)-1", f"MaxFramesPerCol*{x}")
 
-        instantiatedPosition = []
-        # Tile instantiations
-        for y, row in enumerate(self.fabric.tile):
-            for x, tile in enumerate(row):
-                tilePortList: List[str] = []
-                tilePortsInfo: List[Tuple[List[Port], int, int]] = []
-                outputSignalList = []
-                tileLocationOffset: List[Tuple[int, int]] = []
-                superTileLoc = []
-                superTile = None
-                if tile == None:
-                    continue
+        instantiatedPosition = set()
+        tilePorts = _directionalPorts(
+            t for row in self.fabric.tile for t in row)
+        # a normal tile connects its input ports to the signals of the same name
+        tileInputNames = {name: {d: [p.name for p in ports] for d, ports in v[IO.INPUT].items()}
+                          for name, v in tilePorts.items()}
+        tileOutputNames: Dict[str, List[str]] = {}
+        # the names of the ports a tile type drives into each direction, the neighbouring instances only add
+        # their location prefix to them
+        tileDrivenNames = {name: {d: [p.name for p in ports] for d, ports in v[IO.OUTPUT].items()}
+                           for name, v in tilePorts.items()}
+        # per super tile type the tile location offsets and the output ports around it as (i, j, port name),
+        # the instances of a super tile only fill in their location
+        superTileTemplates: Dict[str, Tuple[List[Tuple[int, int]], List[Tuple[int, int, str]]]] = {}
+        # reverse lookup from a tile name to the first super tile containing it
+        superTileOfTile: Dict[str, SuperTile] = {}
+        for v in self.fabric.superTileDic.values():
+            for t in v.tiles:
+                superTileOfTile.setdefault(t.name, v)
+        # Tile instantiations, the empty cells are already skipped by occupiedTiles
+        for x, y, tile in occupiedTiles:
+            tilePortList: List[str] = []
+            tilePortsInfo: List[Tuple[List[Port], int, int]] = []
+            outputSignalList = []
+            tileLocationOffset: List[Tuple[int, int]] = []
+            superTileLoc = set()
+            superTile = None
+
+            if (x, y) in instantiatedPosition:
+                continue
 
-                if (x, y) in instantiatedPosition:
-                    continue
+            # instantiate super tile when encountered
+            # get all the ports of the tile. If is a super tile, we loop over the
+            # tile map and find all the offset of the subtile, and all their related
+            # ports.
+            if tile.partOfSuperTile:
+                superTile = superTileOfTile.get(tile.name)
 
-                # instantiate super tile when encountered
-                # get all the ports of the tile. If is a super tile, we loop over the
-                # tile map and find all the offset of the subtile, and all their related
-                # ports.
-                if tile.partOfSuperTile:
-                    for k, v in self.fabric.superTileDic.items():
-                        if tile.name in [i.name for i in v.tiles]:
-                            superTile = self.fabric.superTileDic[k]
-                            break
-
-                if superTile:
+            if superTile:
+                # the ports around the super tile are used for the location offsets and the output signals
+                if superTile.name not in superTileTemplates:
                     portsAround = superTile.getPortsAroundTile()
-                    cord = [(i.split(",")[0], i.split(",")[1])
-                            for i in list(portsAround.keys())]
-                    for (i, j) in cord:
-                        tileLocationOffset.append((int(i), int(j)))
-                        instantiatedPosition.append((x+int(i), y+int(j)))
-                        superTileLoc.append((x+int(i), y+int(j)))
-                else:
-                    tileLocationOffset.append((0, 0))
+                    cord = [tuple(int(c) for c in k.split(","))
+                            for k in portsAround]
+                    superTileTemplates[superTile.name] = (
+                        cord,
+                        [(i, j, port.name)
+                         for (i, j), around in zip(cord, portsAround.values())
+                         for ports in around for port in ports
+                         if port.inOut == IO.OUTPUT and port.name != "NULL"])
+                cord, superTileOutputs = superTileTemplates[superTile.name]
+                for (i, j) in cord:
+                    tileLocationOffset.append((i, j))
+                    instantiatedPosition.add((x+i, y+j))
+                    superTileLoc.add((x+i, y+j))
+            else:
+                tileLocationOffset.append((0, 0))
 
-                portsPairs = []
-                # use the offset to find all the related tile input, output signal
-                # if is a normal tile then the offset is (0, 0)
-                for i, j in tileLocationOffset:
-                    # input connection from north side of the south tile
-                    if 0 <= y + 1 < len(self.fabric.tile) and self.fabric.tile[y+j+1][x+i] != None and (x+i, y+j+1) not in superTileLoc:
-                        if self.fabric.tile[y+j][x+i].partOfSuperTile:
-                            northPorts = [
-                                f"Tile_X{i}Y{j}_{p.name}" for p in self.fabric.tile[y+j][x+i].getNorthPorts(IO.INPUT)]
-                        else:
-                            northPorts = [
-                                i.name for i in self.fabric.tile[y+j][x+i].getNorthPorts(IO.INPUT)]
-
-                        northInput = [
-                            f"Tile_X{x+i}Y{y+j+1}_{p.name}" for p in self.fabric.tile[y+j+1][x+i].getNorthPorts(IO.OUTPUT)]
-                        portsPairs += list(zip(northPorts, northInput))
-
-                    # input connection from east side of the west tile
-                    if 0 <= x - 1 < len(self.fabric.tile[0]) and self.fabric.tile[y+j][x+i-1] != None and (x+i-1, y+j) not in superTileLoc:
-                        if self.fabric.tile[y+j][x+i].partOfSuperTile:
-                            eastPorts = [
-                                f"Tile_X{i}Y{j}_{p.name}" for p in self.fabric.tile[y+j][x+i].getEastPorts(IO.INPUT)]
-                        else:
-                            eastPorts = [
-                                i.name for i in self.fabric.tile[y+j][x+i].getEastPorts(IO.INPUT)]
-
-                        eastInput = [
-                            f"Tile_X{x+i-1}Y{y+j}_{p.name}" for p in self.fabric.tile[y+j][x+i-1].getEastPorts(IO.OUTPUT)]
-                        portsPairs += list(zip(eastPorts, eastInput))
-
-                    # input connection from south side of the north tile
-                    if 0 <= y - 1 < len(self.fabric.tile) and self.fabric.tile[y+j-1][x+i] != None and (x+i, y+j-1) not in superTileLoc:
-                        if self.fabric.tile[y+j][x+i].partOfSuperTile:
-                            southPorts = [
-                                f"Tile_X{i}Y{j}_{p.name}" for p in self.fabric.tile[y+j][x+i].getSouthPorts(IO.INPUT)]
-                        else:
-                            southPorts = [
-                                i.name for i in self.fabric.tile[y+j][x+i].getSouthPorts(IO.INPUT)]
-
-                        southInput = [
-                            f"Tile_X{x+i}Y{y+j-1}_{p.name}" for p in self.fabric.tile[y+j-1][x+i].getSouthPorts(IO.OUTPUT)]
-                        portsPairs += list(zip(southPorts, southInput))
-
-                    # input connection from west side of the east tile
-                    if 0 <= x + 1 < len(self.fabric.tile[0]) and self.fabric.tile[y+j][x+i+1] != None and (x+i+1, y+j) not in superTileLoc:
-                        if self.fabric.tile[y+j][x+i].partOfSuperTile:
-                            westPorts = [
-                                f"Tile_X{i}Y{j}_{p.name}" for p in self.fabric.tile[y+j][x+i].getWestPorts(IO.INPUT)]
-                        else:
-                            westPorts = [
-                                i.name for i in self.fabric.tile[y+j][x+i].getWestPorts(IO.INPUT)]
-
-                        westInput = [
-                            f"Tile_X{x+i+1}Y{y+j}_{p.name}" for p in self.fabric.tile[y+j][x+i+1].getWestPorts(IO.OUTPUT)]
-                        portsPairs += list(zip(westPorts, westInput))
-
-                # output signal name is same as the output port name
-                if superTile:
-                    portsAround = superTile.getPortsAroundTile()
-                    cord = [(i.split(",")[0], i.split(",")[1])
-                            for i in list(portsAround.keys())]
-                    cord = list(zip(cord, portsAround.values()))
-                    for (i, j), around in cord:
-                        for ports in around:
-                            for port in ports:
-                                if port.inOut == IO.OUTPUT and port.name != "NULL":
-                                    portsPairs.append(
-                                        (f"Tile_X{int(i)}Y{int(j)}_{port.name}", f"Tile_X{x+int(i)}Y{y+int(j)}_{port.name}"))
-                else:
-                    for i in tile.getTileOutputNames():
-                        portsPairs.append((i, f"Tile_X{x}Y{y}_{i}"))
+            portsPairs = []
+            # use the offset to find all the related tile input, output signal
+            # if is a normal tile then the offset is (0, 0)
+            for i, j in tileLocationOffset:
+                current = self.fabric.tile[y+j][x+i]
+                # the tile driving each side as (side, neighbour x, neighbour y):
+                # north side of the south tile, east side of the west tile,
+                # south side of the north tile and west side of the east tile
+                neighbours = ((Direction.NORTH, x+i, y+j+1),
+                              (Direction.EAST, x+i-1, y+j),
+                              (Direction.SOUTH, x+i, y+j-1),
+                              (Direction.WEST, x+i+1, y+j))
+                for direction, nx, ny in neighbours:
+                    neighbour = tileAt(nx, ny)
+                    if neighbour is None or (nx, ny) in superTileLoc:
+                        continue
+                    if current.partOfSuperTile:
+                        ports = [
+                            f"Tile_X{i}Y{j}_{p.name}" for p in tilePorts[current.name][IO.INPUT][direction]]
+                    else:
+                        ports = tileInputNames[current.name][direction]
 
-                self.writer.addNewLine()
-                self.writer.addComment(
-                    "tile IO port will get directly connected to top-level tile module", onNewLine=True, indentLevel=0)
-                for (i, j) in tileLocationOffset:
-                    for b in self.fabric.tile[y+j][x+i].bels:
-                        for p in b.externalInput:
-                            portsPairs.append((p, f"Tile_X{x+i}Y{y+j}_{p}"))
-
-                        for p in b.externalOutput:
-                            portsPairs.append((p, f"Tile_X{x+i}Y{y+j}_{p}"))
-
-                        for p in b.sharedPort:
-                            if "UserCLK" not in p[0]:
-                                portsPairs.append(("UserCLK", p[0]))
-
-                if not superTile:
-                    # for userCLK
-                    if y + 1 < self.fabric.numberOfRows and self.fabric.tile[y+1][x] != None:
-                        portsPairs.append(
-                            ("UserCLK", f"Tile_X{x}Y{y+1}_UserCLKo"))
+                    neighbourPrefix = f"Tile_X{nx}Y{ny}_"
+                    portsPairs.extend(zip(ports, (neighbourPrefix + n
+                                                  for n in tileDrivenNames[neighbour.name][direction])))
+
+            # output signal name is same as the output port name
+            if superTile:
+                portsPairs.extend((f"Tile_X{i}Y{j}_{name}", f"Tile_X{x+i}Y{y+j}_{name}")
+                                  for i, j, name in superTileOutputs)
+            else:
+                if tile.name not in tileOutputNames:
+                    tileOutputNames[tile.name] = tile.getTileOutputNames()
+                prefix = f"Tile_X{x}Y{y}_"
+                portsPairs.extend((i, prefix + i)
+                                  for i in tileOutputNames[tile.name])
+
+            self.writer.addNewLine()
+            self.writer.addComment(
+                "tile IO port will get directly connected to top-level tile module", onNewLine=True, indentLevel=0)
+            for (i, j) in tileLocationOffset:
+                locationPrefix = f"Tile_X{x+i}Y{y+j}_"
+                for p, io, external in belTopPorts[self.fabric.tile[y+j][x+i].name]:
+                    if external:
+                        portsPairs.append((p, locationPrefix + p))
                     else:
-                        portsPairs.append(("UserCLK", "UserCLK"))
+                        portsPairs.append(("UserCLK", p))
 
-                    # for userCLKo
-                    portsPairs.append(("UserCLKo", f"Tile_X{x}Y{y}_UserCLKo"))
+            if not superTile:
+                # for userCLK
+                if tileAt(x, y + 1) is not None:
+                    portsPairs.append(
+                        ("UserCLK", f"Tile_X{x}Y{y+1}_UserCLKo"))
                 else:
-                    if y + 1 < self.fabric.numberOfRows:
-                        portsPairs.append(
-                            ("UserCLK", f"Tile_X{x}Y{y+1}_UserCLKo"))
-                    else:
-                        portsPairs.append(("UserCLK", "UserCLK"))
+                    portsPairs.append(("UserCLK", "UserCLK"))
 
-                if self.fabric.configBitMode == ConfigBitMode.FRAME_BASED:
-                    for (i, j) in tileLocationOffset:
-                        # prefix for super tile port
-                        if superTile:
-                            pre = f"Tile_X{i}Y{j}_"
-                        else:
-                            pre = ""
-                        if tile.globalConfigBits > 0 or superTile:
-                            # frameData signal
-                            if x == 0:
-                                portsPairs.append(
-                                    (f"{pre}FrameData", f"Tile_Y{y}_FrameData"))
-
-                            elif (x+i-1, y+j) not in superTileLoc:
-                                portsPairs.append(
-                                    (f"{pre}FrameData", f"Tile_X{x+i-1}Y{y+j}_FrameData_O"))
-
-                            # frameData_O signal
-                            if x == len(self.fabric.tile[0]) - 1:
-                                portsPairs.append(
-                                    (f"{pre}FrameData_O", f"Tile_X{x}Y{y}_FrameData_O"))
-
-                            elif (x+i-1, y+j) not in superTileLoc:
-                                portsPairs.append(
-                                    (f"{pre}FrameData_O", f"Tile_X{x+i}Y{y+j}_FrameData_O"))
-
-                    for (i, j) in tileLocationOffset:
-                        # prefix for super tile port
-                        if superTile:
-                            pre = f"Tile_X{i}Y{j}_"
-                        else:
-                            pre = ""
-                        # frameStrobe signal
-                        if y + 1 >= self.fabric.numberOfRows:
-                            portsPairs.append(
-                                (f"{pre}FrameStrobe", f"Tile_X{x}_FrameStrobe"))
-
-                        elif y + 1 < self.fabric.numberOfRows and self.fabric.tile[y+1][x] == None:
-                            portsPairs.append(
-                                (f"{pre}FrameStrobe", f"Tile_X{x}_FrameStrobe"))
-
-                        elif (x+i, y+j+1) not in superTileLoc:
-                            portsPairs.append(
-                                (f"{pre}FrameStrobe", f"Tile_X{x+i}Y{y+j+1}_FrameStrobe_O"))
-
-                        # frameStrobe_O signal
-                        if (x+i, y+j-1) not in superTileLoc:
-                            portsPairs.append(
-                                (f"{pre}FrameStrobe_O", f"Tile_X{x+i}Y{y+j}_FrameStrobe_O"))
-
-                name = ""
-                if superTile:
-                    name = superTile.name
+                # for userCLKo
+                portsPairs.append(("UserCLKo", f"Tile_X{x}Y{y}_UserCLKo"))
+            else:
+                if y + 1 < self.fabric.numberOfRows:
+                    portsPairs.append(
+                        ("UserCLK", f"Tile_X{x}Y{y+1}_UserCLKo"))
                 else:
-                    name = tile.name
+                    portsPairs.append(("UserCLK", "UserCLK"))
 
-                self.writer.addInstantiation(compName=name,
-                                             compInsName=f"Tile_X{x}Y{y}_{name}",
-                                             portsPairs=portsPairs)
+            if self.fabric.configBitMode == ConfigBitMode.FRAME_BASED:
+                # the frame wiring only depends on where the tile sits in the fabric, so the edge checks are done
+                # once per tile instead of once per port of every tile location
+                firstColumn = x == 0
+                lastColumn = x == fabricWidth - 1
+                strobeFromBelow = tileAt(x, y + 1) is not None
+                # prefix for super tile port
+                offsetPrefixes = [(i, j, f"Tile_X{i}Y{j}_" if superTile else "")
+                                  for (i, j) in tileLocationOffset]
+                if tile.globalConfigBits > 0 or superTile:
+                    for i, j, pre in offsetPrefixes:
+                        # frameData signal, from the row or from the instance on the left
+                        fromLeft = (x+i-1, y+j) not in superTileLoc
+                        if firstColumn:
+                            portsPairs.append((f"{pre}FrameData", rowFrameData[y]))
+                        elif fromLeft:
+                            portsPairs.append((f"{pre}FrameData", frameDataOut[y+j][x+i-1]))
+
+                        # frameData_O signal
+                        if lastColumn:
+                            portsPairs.append((f"{pre}FrameData_O", frameDataOut[y][x]))
+                        elif fromLeft:
+                            portsPairs.append((f"{pre}FrameData_O", frameDataOut[y+j][x+i]))
+
+                for i, j, pre in offsetPrefixes:
+                    # frameStrobe signal, from the column or from the instance below
+                    if not strobeFromBelow:
+                        portsPairs.append((f"{pre}FrameStrobe", columnFrameStrobe[x]))
+                    elif (x+i, y+j+1) not in superTileLoc:
+                        portsPairs.append((f"{pre}FrameStrobe", frameStrobeOut[y+j+1][x+i]))
+
+                    # frameStrobe_O signal
+                    if (x+i, y+j-1) not in superTileLoc:
+                        portsPairs.append((f"{pre}FrameStrobe_O", frameStrobeOut[y+j][x+i]))
+
+            name = ""
+            if superTile:
+                name = superTile.name
+            else:
+                name = tile.name
+
+            self.writer.addInstantiation(compName=name,
+                                         compInsName=f"Tile_X{x}Y{y}_{name}",
+                                         portsPairs=portsPairs)
         self.writer.addDesignDescriptionEnd()
         self.writer.writeToFile()
 
@@ -1803,50 +1789,44 @@ class FabricGenerator:
 
         signal += [f"B_config_C[{i}]" for i in range(numberOfRows*4-1, -1, -1)]
 
-        # RAM_IO ports
-        for i in range(1, self.fabric.numberOfRows - 1):
+        # RAM_IO ports, on the tiles of the last column
+        ramTilePrefixes = [f"Tile_X{self.fabric.numberOfColumns-1}Y{i}_"
+                           for i in range(1, self.fabric.numberOfRows - 1)]
+        for prefix in ramTilePrefixes:
             for j in range(4):
                 for k in range(4):
-                    portList.append(
-                        f"Tile_X{self.fabric.numberOfColumns-1}Y{i}_RAM2FAB_D{j}_I{k}")
+                    portList.append(f"{prefix}RAM2FAB_D{j}_I{k}")
 
         signal += [f"RAM2FAB_D[{i}]" for i in range(
             numberOfRows*4*4-1, -1, -1)]
 
-        for i in range(1, self.fabric.numberOfRows - 1):
+        for prefix in ramTilePrefixes:
             for j in range(4):
                 for k in range(4):
-                    portList.append(
-                        f"Tile_X{self.fabric.numberOfColumns-1}Y{i}_FAB2RAM_D{j}_O{k}")
+                    portList.append(f"{prefix}FAB2RAM_D{j}_O{k}")
 
         signal += [f"FAB2RAM_D[{i}]" for i in range(
             numberOfRows*4*4-1, -1, -1)]
 
-        for i in range(1, self.fabric.numberOfRows - 1):
+        for prefix in ramTilePrefixes:
             for j in range(2):
                 for k in range(4):
-                    portList.append(
-                        f"Tile_X{self.fabric.numberOfColumns-1}Y{i}_FAB2RAM_A{j}_O{k}")
+                    portList.append(f"{prefix}FAB2RAM_A{j}_O{k}")
 
         signal += [f"FAB2RAM_A[{i}]" for i in range(
             numberOfRows*2*4-1, -1, -1)]
 
-        for i in range(1, self.fabric.numberOfRows - 1):
+        for prefix in ramTilePrefixes:
             for j in range(4):
-                portList.append(
-                    f"Tile_X{self.fabric.numberOfColumns-1}Y{i}_FAB2RAM_C_O{j}")
+                portList.append(f"{prefix}FAB2RAM_C_O{j}")
 
         signal += [f"FAB2RAM_C[{i}]" for i in range(numberOfRows*4-1, -1, -1)]
 
-        for i in range(1, self.fabric.numberOfRows - 1):
-            portList.append(
-                f"Tile_X{self.fabric.numberOfColumns-1}Y{i}_Config_accessC_bit0")
-            portList.append(
-                f"Tile_X{self.fabric.numberOfColumns-1}Y{i}_Config_accessC_bit1")
-            portList.append(
-                f"Tile_X{self.fabric.numberOfColumns-1}Y{i}_Config_accessC_bit2")
-            portList.append(
-                f"Tile_X{self.fabric.numberOfColumns-1}Y{i}_Config_accessC_bit3")
+        for prefix in ramTilePrefixes:
+            portList.append(f"{prefix}Config_accessC_bit0")
+            portList.append(f"{prefix}Config_accessC_bit1")
+            portList.append(f"{prefix}Config_accessC_bit2")
+            portList.append(f"{prefix}Config_accessC_bit3")
 
         signal += [f"Config_accessC[{i}]" for i in range(
             numberOfRows*4-1, -1, -1)]
@@ -1904,6 +1884,9 @@ class FabricGenerator:
         """
         Generate the bits stream specification of the fabric. This is need and will be further parsed by the bit_gen.py
 
+        The entries of "TileSpecs" and "TileSpecs_No_Mask" are shared between all the locations holding the same tile
+        type, also in the pickled specification, and have to be treated as read-only.
+
         Returns:
             dict[str, dict]: The bits stream specification of the fabric
         """
@@ -1926,10 +1909,21 @@ class FabricGenerator:
 
         specData["TileMap"] = tileMap
         configMemList: List[ConfigMem] = []
+        # every instance of a tile type has the same bitstream spec, so the config memory and the switch matrix of a
+        # tile type are only parsed once and the other locations holding that type share the result
+        tileSpecs: Dict[str, Tuple[Dict, Dict]] = {}
         for y, row in enumerate(self.fabric.tile):
             for x, tile in enumerate(row):
                 if tile == None:
                     continue
+                if tile.name in tileSpecs:
+                    if tile.globalConfigBits == 0:
+                        logger.info(f"No config memory for X{x}Y{y}_{tile.name}.")
+                    # the locations hold their own copy of the tile, so the switch matrix update is still applied to each
+                    if tile.matrixDir.endswith(".list"):
+                        tile.matrixDir = tile.matrixDir.replace(".list", ".csv")
+                    specData["TileSpecs"][f"X{x}Y{y}"], specData["TileSpecs_No_Mask"][f"X{x}Y{y}"] = tileSpecs[tile.name]
+                    continue
                 if os.path.exists(f"{tile.filePath}/{tile.name}_ConfigMem.csv"):
                     configMemList = parseConfigMem(
                         f"{tile.filePath}/{tile.name}_ConfigMem.csv", self.fabric.maxFramesPerCol, self.fabric.frameBitsPerRow, tile.globalConfigBits)
@@ -2011,5 +2005,6 @@ class FabricGenerator:
 
                 specData["TileSpecs"][f"X{x}Y{y}"] = curTileMap
                 specData["TileSpecs_No_Mask"][f"X{x}Y{y}"] = curTileMapNoMask
+                tileSpecs[tile.name] = (curTileMap, curTileMapNoMask)
 
         return specData
@@ -1,3 +1,4 @@
+import io
 import re
 from array import *
 import fileinput
@@ -154,71 +155,85 @@ def main(argv):
     configfsm_str = configfsm_str.replace("parameter FrameBitsPerRow = 32", "parameter FrameBitsPerRow = "+str(FrameBitsPerRow))
     configfsm_str = configfsm_str.replace("parameter desync_flag = 20", "parameter desync_flag = "+str(desync_flag))
     
+    # the top module and the register packs are built in memory and each file is written in one go
+    wrapper_top = io.StringIO()
+    wrapper_top.write(wrapper_top_str)
+    data_reg_pack = io.StringIO()
+    strobe_reg_pack = io.StringIO()
+
+    # the register templates are the same for every row and column, so they are only read once
+    data_reg_template = None
+    try:
+        with open("fabulous_top_wrapper_temp/Frame_Data_Reg_template.v", 'r') as file :
+            data_reg_template = file.read()
+    except IOError:
+        pass
+    strobe_reg_template = None
+    try:
+        with open("fabulous_top_wrapper_temp/Frame_Select_template.v", 'r') as file :
+            strobe_reg_template = file.read()
+    except IOError:
+        pass
+
     for row in range(NumberOfRows):
-        data_reg_module_temp =""
-        
         data_reg_name = 'Frame_Data_Reg_'+str(row)
-        wrapper_top_str+='\t'+data_reg_name+' Inst_'+data_reg_name+' (\n'
-        wrapper_top_str+='\t.FrameData_I(LocalWriteData),\n'
-        wrapper_top_str+='\t.FrameData_O(FrameRegister['+str(row)+'*FrameBitsPerRow+:FrameBitsPerRow]),\n'
-        wrapper_top_str+='\t.RowSelect(RowSelect),\n'
-        wrapper_top_str+='\t.CLK(CLK)\n'
-        wrapper_top_str+='\t);\n\n'
+        wrapper_top.write('\t'+data_reg_name+' Inst_'+data_reg_name+' (\n')
+        wrapper_top.write('\t.FrameData_I(LocalWriteData),\n')
+        wrapper_top.write('\t.FrameData_O(FrameRegister['+str(row)+'*FrameBitsPerRow+:FrameBitsPerRow]),\n')
+        wrapper_top.write('\t.RowSelect(RowSelect),\n')
+        wrapper_top.write('\t.CLK(CLK)\n')
+        wrapper_top.write('\t);\n\n')
         #data_reg_modules += 'module '+data_reg_name+' (FrameData_I, FrameData_O, RowSelect, CLK);'
-        try:
-            with open("fabulous_top_wrapper_temp/Frame_Data_Reg_template.v", 'r') as file :
-                data_reg_module_temp = file.read()
-        except IOError:
+        if data_reg_template is None:
             print("Frame_Data_Reg_template.v not accessible")
             break
-        data_reg_module_temp=data_reg_module_temp.replace("Frame_Data_Reg", data_reg_name)
+        data_reg_module_temp=data_reg_template.replace("Frame_Data_Reg", data_reg_name)
         data_reg_module_temp=data_reg_module_temp.replace("parameter FrameBitsPerRow = 32", "parameter FrameBitsPerRow = "+str(FrameBitsPerRow))
         data_reg_module_temp=data_reg_module_temp.replace("parameter RowSelectWidth = 5", "parameter RowSelectWidth = "+str(RowSelectWidth))
         data_reg_module_temp=data_reg_module_temp.replace("parameter Row = 1", "parameter Row = "+str(row+1))
-        data_reg_modules += data_reg_module_temp+'\n\n'
+        data_reg_pack.write(data_reg_module_temp+'\n\n')
         #with open("verilog_output/"+data_reg_name+".v", 'w') as file:
         #    file.write(data_reg_module_temp)
         
     for col in range(NumberOfCols):
-        strobe_reg_module_temp =""
-        
         strobe_reg_name = 'Frame_Select_'+str(col)
-        wrapper_top_str+='\t'+strobe_reg_name+' Inst_'+strobe_reg_name+' (\n'
-        wrapper_top_str+='\t.FrameStrobe_I(FrameAddressRegister[MaxFramesPerCol-1:0]),\n'
-        wrapper_top_str+='\t.FrameStrobe_O(FrameSelect['+str(col)+'*MaxFramesPerCol +: MaxFramesPerCol]),\n'
-        wrapper_top_str+='\t.FrameSelect(FrameAddressRegister[FrameBitsPerRow-1:FrameBitsPerRow-(FrameSelectWidth)]),\n'
-        wrapper_top_str+='\t.FrameStrobe(LongFrameStrobe)\n'
-        wrapper_top_str+='\t);\n\n'
-        try:
-            with open("fabulous_top_wrapper_temp/Frame_Select_template.v", 'r') as file :
-                strobe_reg_module_temp = file.read()
-        except IOError:
+        wrapper_top.write('\t'+strobe_reg_name+' Inst_'+strobe_reg_name+' (\n')
+        wrapper_top.write('\t.FrameStrobe_I(FrameAddressRegister[MaxFramesPerCol-1:0]),\n')
+        wrapper_top.write('\t.FrameStrobe_O(FrameSelect['+str(col)+'*MaxFramesPerCol +: MaxFramesPerCol]),\n')
+        wrapper_top.write('\t.FrameSelect(FrameAddressRegister[FrameBitsPerRow-1:FrameBitsPerRow-(FrameSelectWidth)]),\n')
+        wrapper_top.write('\t.FrameStrobe(LongFrameStrobe)\n')
+        wrapper_top.write('\t);\n\n')
+        if strobe_reg_template is None:
             print("Frame_Select_template.v not accessible")
             break
-        strobe_reg_module_temp=strobe_reg_module_temp.replace("Frame_Select", strobe_reg_name)
+        strobe_reg_module_temp=strobe_reg_template.replace("Frame_Select", strobe_reg_name)
         strobe_reg_module_temp=strobe_reg_module_temp.replace("parameter MaxFramesPerCol = 20", "parameter MaxFramesPerCol = "+str(MaxFramesPerCol))
         strobe_reg_module_temp=strobe_reg_module_temp.replace("parameter FrameSelectWidth = 5", "parameter FrameSelectWidth = "+str(FrameSelectWidth))
         strobe_reg_module_temp=strobe_reg_module_temp.replace("parameter Col = 18", "parameter Col = "+str(col))
-        strobe_reg_modules += strobe_reg_module_temp+'\n\n'
+        strobe_reg_pack.write(strobe_reg_module_temp+'\n\n')
         #with open("verilog_output/"+strobe_reg_name+".v", 'w') as file:
         #    file.write(strobe_reg_module_temp)
 
-    #wrapper_top_str+='\twire ['+str(NumberOfRows-1)+':0] dump;\n\n'
-    wrapper_top_str+='\teFPGA Inst_eFPGA(\n'
+    #wrapper_top.write('\twire ['+str(NumberOfRows-1)+':0] dump;\n\n')
+    wrapper_top.write('\teFPGA Inst_eFPGA(\n')
 
     # external IO connectivity
     for name, group in sorted(port_groups.items(), key=lambda x:x[0]):
         for i, sig in enumerate(group[1]):
-            wrapper_top_str += f"\t.{sig}({name}[{i}]),\n"
+            wrapper_top.write(f"\t.{sig}({name}[{i}]),\n")
 
-    wrapper_top_str+='\t//declarations\n'
-    wrapper_top_str+='\t.UserCLK(CLK),\n'
-    wrapper_top_str+='\t.FrameData(FrameData),\n'
-    wrapper_top_str+='\t.FrameStrobe(FrameSelect)\n'
-    wrapper_top_str+='\t);\n\n'
+    wrapper_top.write('\t//declarations\n')
+    wrapper_top.write('\t.UserCLK(CLK),\n')
+    wrapper_top.write('\t.FrameData(FrameData),\n')
+    wrapper_top.write('\t.FrameStrobe(FrameSelect)\n')
+    wrapper_top.write('\t);\n\n')
     
-    wrapper_top_str+="\tassign FrameData = {32'h12345678,FrameRegister,32'h12345678};\n\n"
-    wrapper_top_str+='endmodule\n\n'
+    wrapper_top.write("\tassign FrameData = {32'h12345678,FrameRegister,32'h12345678};\n\n")
+    wrapper_top.write('endmodule\n\n')
+
+    wrapper_top_str = wrapper_top.getvalue()
+    data_reg_modules = data_reg_pack.getvalue()
+    strobe_reg_modules = strobe_reg_pack.getvalue()
 
     if wrapper_top_str:
         with open("eFPGA_top.v", 'w') as file:
@@ -1,8 +1,10 @@
 import re
 from copy import deepcopy
+from functools import lru_cache, wraps
 from typing import Dict, List, Literal, Tuple, Union, overload
 import csv
 import os
+import sys
 
 from fabric_generator.fabric import Fabric, Port, Bel, Tile, SuperTile, ConfigMem
 from fabric_generator.fabric import IO, Direction, Side, MultiplexerStyle, ConfigBitMode
@@ -14,6 +16,27 @@ from fabric_generator.fabric import IO, Direction, Side, MultiplexerStyle, Confi
 oppositeDic = {"NORTH": "SOUTH", "SOUTH": "NORTH",
                "EAST": "WEST", "WEST": "EAST"}
 
+# matched against the raw bytes of a switch matrix file, so only the digits need decoding
+_NCB_RE = re.compile(rb"NumberOfConfigBits: (\d+)")
+# translation table deleting the pretty print underscores of a used_bits_mask
+_DROP_US = str.maketrans("", "", "_")
+# VHDL port modes to port directions
+_VHDL_PORT_IO = {"in": IO.INPUT, "out": IO.OUTPUT, "inout": IO.INOUT}
+# the type and everything after it in a VHDL port line, or from the semicolon if that comes first
+_VHDL_PORT_TYPE_RE = re.compile(r"STD_LOGIC.*|;.*", flags=re.IGNORECASE)
+# translation table deleting the blanks and dashes left in a VHDL port line
+_DROP_PORT_BLANKS = str.maketrans("", "", " \t;-")
+# patterns applied to every port line of a BEL file, compiled once
+_VHDL_PORT_RE = re.compile(r"(.*):(.*)")
+_VERILOG_PORT_RE = re.compile(r".*(input|output|inout).*?(\w+);", re.IGNORECASE)
+_FABULOUS_ATTRIBUTE_RE = re.compile(r"\(\*FABulous,(.*)\*\)")
+# patterns applied once to the whole of a BEL file
+_NO_CONFIG_BITS_RE = re.compile(r"NoConfigBits.*?=.*?(\d+)", re.IGNORECASE)
+_NO_CONFIG_BITS_GENERIC_RE = re.compile(
+    r"NoConfigBits\s*:\s*integer\s*:=\s*(\w+)", re.IGNORECASE | re.DOTALL)
+_VHDL_PORT_SECTION_RE = re.compile(
+    r"port.*?\((.*?)\);", re.MULTILINE | re.DOTALL | re.IGNORECASE)
+
 
 def parseFabricCSV(fileName: str) -> Fabric:
     """
@@ -91,6 +114,10 @@ def parseFabricCSV(fileName: str) -> Fabric:
             temp: List[str] = item.split(",")
             if not temp or temp[0] == "":
                 continue
+            if temp[0] in ["NORTH", "SOUTH", "EAST", "WEST", "JUMP"]:
+                # the wire names are compared and hashed over and over again during generation (most often
+                # against "NULL"), interning them lets these comparisons succeed on identity
+                temp[1], temp[4] = sys.intern(temp[1]), sys.intern(temp[4])
             if temp[0] in ["NORTH", "SOUTH", "EAST", "WEST"]:
                 ports.append(Port(Direction[temp[0]], temp[1], int(
                     temp[2]), int(temp[3]), temp[4], int(temp[5]), temp[1], IO.OUTPUT, Side[temp[0]]))
@@ -135,9 +162,9 @@ def parseFabricCSV(fileName: str) -> Fabric:
                         if muxSize >= 2:
                             configBit += muxSize.bit_length()-1
                 elif temp[1].endswith(".vhdl") or temp[1].endswith(".v"):
-                    with open(matrixDir, "r") as f:
+                    with open(matrixDir, "rb") as f:
                         f = f.read()
-                        if configBit := re.search(r"NumberOfConfigBits: (\d+)", f):
+                        if configBit := _NCB_RE.search(f):
                             configBit = int(configBit.group(1))
                         else:
                             configBit = 0
@@ -163,7 +190,8 @@ def parseFabricCSV(fileName: str) -> Fabric:
         description = t.split("\n")
         name = description[0].split(",")[1]
         tileMap = []
-        tiles = []
+        # the distinct tiles of the super tile in order of appearance, keyed by name as tiles compare by name
+        tiles: Dict[str, Tile] = {}
         bels = []
         withUserCLK = False
         for i in description[1:-1]:
@@ -189,8 +217,7 @@ def parseFabricCSV(fileName: str) -> Fabric:
                     tileDic[j].partOfSuperTile = True
                     t = deepcopy(tileDic[j])
                     row.append(t)
-                    if t not in tiles:
-                        tiles.append(t)
+                    tiles.setdefault(t.name, t)
                 elif j == "Null" or j == "NULL" or j == "None":
                     row.append(None)
                 else:
@@ -198,7 +225,8 @@ def parseFabricCSV(fileName: str) -> Fabric:
                         f"The super tile {name} contains definitions that are not tiles or Null.")
             tileMap.append(row)
 
-        superTileDic[name] = SuperTile(name, tiles, tileMap, bels, withUserCLK)
+        superTileDic[name] = SuperTile(
+            name, list(tiles.values()), tileMap, bels, withUserCLK)
 
     # form the fabric data structure
     usedTile = set()
@@ -379,7 +407,7 @@ def _expandListPorts(port, PortList):
         # right_index is the position of the ']' so we need everything after that
         after_right_index = port[(right_index+1):]
         ExpandList = []
-        ExpandList = re.split(r"\|", port[left_index+1:right_index])
+        ExpandList = port[left_index+1:right_index].split("|")
         for entry in ExpandList:
             ExpandListItem = (before_left_index+entry+after_right_index)
             _expandListPorts(ExpandListItem, PortList)
@@ -390,6 +418,61 @@ def _expandListPorts(port, PortList):
     return
 
 
+def fileVersion(filename: str) -> Tuple[int, int]:
+    """
+    Get the modification time and size of a file. The file caches use them to tell whether a cached result is
+    still valid.
+
+    Args:
+        filename (str): The file name
+
+    Raises:
+        FileNotFoundError: The file does not exist
+
+    Returns:
+        Tuple[int, int]: The modification time in nanoseconds and the size of the file
+    """
+    stat = os.stat(filename)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# the number of results kept by each file cache. Every change of a file on disk adds a new entry, so the caches are
+# bounded to keep a long running session from holding on to the results for every old version of the files
+FILE_CACHE_SIZE = 256
+
+
+def cacheByFileVersion(function):
+    """
+    Cache a function reading the file given as its first argument. The results are kept for each version of the
+    file as given by `fileVersion`, so the file is read again once it changes on disk. At most `FILE_CACHE_SIZE`
+    results are kept, the least recently used are dropped first.
+
+    Args:
+        function: The function to cache. Its arguments have to be positional and hashable.
+
+    Raises:
+        FileNotFoundError: The file does not exist
+
+    Returns:
+        The cached function, taking the same arguments as `function`
+    """
+    @lru_cache(maxsize=FILE_CACHE_SIZE)
+    def cached(version, fileName, *args):
+        return function(fileName, *args)
+
+    @wraps(function)
+    def wrapper(fileName, *args):
+        return cached(fileVersion(fileName), fileName, *args)
+
+    return wrapper
+
+
+def _copyBelInfo(result):
+    # the cached parse results are shared, so every caller gets its own port lists and BEL map
+    internal, external, config, shared, noConfigBits, userClk, belMapDic = result
+    return internal[:], external[:], config[:], shared[:], noConfigBits, userClk, dict(belMapDic)
+
+
 def parseFileVHDL(filename: str, belPrefix: str = "") -> Tuple[List[Tuple[str, IO]], List[Tuple[str, IO]], List[Tuple[str, IO]], List[Tuple[str, IO]], int, bool, Dict[str, int]]:
     """
     Parse a VHDL bel file and return all the related information of the bel. The tuple returned for relating to ports will
@@ -411,6 +494,18 @@ def parseFileVHDL(filename: str, belPrefix: str = "") -> Tuple[List[Tuple[str, I
         Bel internal ports, bel external ports, bel config ports, bel shared ports, number of configuration bit in the bel,
         whether the bel have UserCLK, and the bel config bit mapping. 
     """
+    # a BEL file is often used by several tiles and with several prefixes, so it is only read and parsed again
+    # when the file on disk has changed
+    try:
+        result = _parseFileVHDLCached(filename, belPrefix)
+    except FileNotFoundError:
+        print(f"File {filename} not found.")
+        exit(-1)
+    return _copyBelInfo(result)
+
+
+@cacheByFileVersion
+def _parseFileVHDLCached(filename: str, belPrefix: str):
     internal: List[Tuple[str, IO]] = []
     external: List[Tuple[str, IO]] = []
     config: List[Tuple[str, IO]] = []
@@ -432,7 +527,7 @@ def parseFileVHDL(filename: str, belPrefix: str = "") -> Tuple[List[Tuple[str, I
 
     belMapDic = _belMapProcessing(file, filename, "vhdl")
 
-    if result := re.search(r"NoConfigBits.*?=.*?(\d+)", file, re.IGNORECASE):
+    if result := _NO_CONFIG_BITS_RE.search(file):
         noConfigBits = int(result.group(1))
     else:
         print(f"Cannot find NoConfigBits in {filename}")
@@ -444,8 +539,7 @@ def parseFileVHDL(filename: str, belPrefix: str = "") -> Tuple[List[Tuple[str, I
             f"NoConfigBits does not match with the BEL map in file {filename}, length of BelMap is {len(belMapDic)}, but with {noConfigBits} config bits")
 
     portSection = ""
-    if result := re.search(r"port.*?\((.*?)\);", file,
-                           re.MULTILINE | re.DOTALL | re.IGNORECASE):
+    if result := _VHDL_PORT_SECTION_RE.search(file):
         portSection = result.group(1)
     else:
         raise ValueError(
@@ -463,46 +557,29 @@ def parseFileVHDL(filename: str, belPrefix: str = "") -> Tuple[List[Tuple[str, I
         if "SHARED_PORT" in line:
             isShared = True
 
-        line = re.sub(r"STD_LOGIC.*", "", line, flags=re.IGNORECASE)
-        line = re.sub(r";.*", "", line, flags=re.IGNORECASE)
-        line = re.sub(r"--*", "", line, flags=re.IGNORECASE)
-        line = line.replace(" ", "").replace("\t", "").replace(";", "")
-        result = re.search(r"(.*):(.*)", line)
+        line = _VHDL_PORT_TYPE_RE.sub("", line).translate(_DROP_PORT_BLANKS)
+        result = _VHDL_PORT_RE.search(line)
         if not result:
             continue
         portName = f"{belPrefix}{result.group(1)}"
+        # the port mode is looked up once, None if it is not a valid mode
+        io = _VHDL_PORT_IO.get(result.group(2).lower())
 
         if isExternal and not isShared:
-            if result.group(2).lower() == "in":
-                external.append((portName, IO.INPUT))
-            elif result.group(2).lower() == "out":
-                external.append((portName, IO.OUTPUT))
+            if io == IO.INPUT or io == IO.OUTPUT:
+                external.append((portName, io))
         elif isConfig:
-            if result.group(2).lower() == "in":
-                config.append((portName, IO.INPUT))
-            elif result.group(2).lower() == "out":
-                config.append((portName, IO.OUTPUT))
+            if io == IO.INPUT or io == IO.OUTPUT:
+                config.append((portName, io))
+        elif io is None:
+            raise ValueError(
+                f"Invalid port type {result.group(2)} in file {filename}")
         elif isShared:
-            # shared port do not have a prefix
-            if result.group(2).lower() == "in":
-                shared.append((result.group(1), IO.INOUT))
-            elif result.group(2).lower() == "out":
-                shared.append((result.group(1), IO.OUTPUT))
-            elif result.group(2).lower() == "inout":
-                shared.append((result.group(1), IO.INOUT))
-            else:
-                raise ValueError(
-                    f"Invalid port type {result.group(2)} in file {filename}")
+            # shared port do not have a prefix, and shared inputs are treated as inout
+            shared.append((result.group(1),
+                           IO.INOUT if io == IO.INPUT else io))
         else:
-            if result.group(2).lower() == "in":
-                internal.append((portName, IO.INPUT))
-            elif result.group(2).lower() == "out":
-                internal.append((portName, IO.OUTPUT))
-            elif result.group(2).lower() == "inout":
-                internal.append((portName, IO.INOUT))
-            else:
-                raise ValueError(
-                    f"Invalid port type {result.group(2)} in file {filename}")
+            internal.append((portName, io))
 
         if "UserCLK" in portName:
             userClk = True
@@ -511,8 +588,7 @@ def parseFileVHDL(filename: str, belPrefix: str = "") -> Tuple[List[Tuple[str, I
         isConfig = False
         isShared = False
 
-    result = re.search(
-        r"NoConfigBits\s*:\s*integer\s*:=\s*(\w+)", file, re.IGNORECASE | re.DOTALL)
+    result = _NO_CONFIG_BITS_GENERIC_RE.search(file)
     if result:
         try:
             noConfigBits = int(result.group(1))
@@ -597,6 +673,18 @@ def parseFileVerilog(filename: str, belPrefix: str = "") -> Tuple[List[Tuple[str
         Bel internal ports, bel external ports, bel config ports, bel shared ports, number of configuration bit in the bel,
         whether the bel have UserCLK, and the bel config bit mapping. 
     """
+    # a BEL file is often used by several tiles and with several prefixes, so it is only read and parsed again
+    # when the file on disk has changed
+    try:
+        result = _parseFileVerilogCached(filename, belPrefix)
+    except FileNotFoundError:
+        print(f"File {filename} not found.")
+        exit(-1)
+    return _copyBelInfo(result)
+
+
+@cacheByFileVersion
+def _parseFileVerilogCached(filename: str, belPrefix: str):
     internal: List[Tuple[str, IO]] = []
     external: List[Tuple[str, IO]] = []
     config: List[Tuple[str, IO]] = []
@@ -619,7 +707,7 @@ def parseFileVerilog(filename: str, belPrefix: str = "") -> Tuple[List[Tuple[str
 
     belMapDic = _belMapProcessing(file, filename, "verilog")
 
-    if result := re.search(r"NoConfigBits.*?=.*?(\d+)", file, re.IGNORECASE):
+    if result := _NO_CONFIG_BITS_RE.search(file):
         noConfigBits = int(result.group(1))
     else:
         print(f"Cannot find NoConfigBits in {filename}")
@@ -633,9 +721,9 @@ def parseFileVerilog(filename: str, belPrefix: str = "") -> Tuple[List[Tuple[str
     file = file.split("\n")
 
     for line in file:
-        if result := re.search(r".*(input|output|inout).*?(\w+);", line, re.IGNORECASE):
+        if result := _VERILOG_PORT_RE.search(line):
             cleanedLine = line.replace(" ", "")
-            if attribute := re.search(r"\(\*FABulous,(.*)\*\)", cleanedLine):
+            if attribute := _FABULOUS_ATTRIBUTE_RE.search(cleanedLine):
                 if "EXTERNAL" in attribute.group(1):
                     isExternal = True
 
@@ -649,16 +737,17 @@ def parseFileVerilog(filename: str, belPrefix: str = "") -> Tuple[List[Tuple[str
                     break
 
             portName = f"{belPrefix}{result.group(2)}"
+            io = IO[result.group(1).upper()]
 
             if isExternal and not isShared:
-                external.append((portName, IO[result.group(1).upper()]))
+                external.append((portName, io))
             elif isConfig:
-                config.append((portName, IO[result.group(1).upper()]))
+                config.append((portName, io))
             elif isShared:
                 # shared port do not have a prefix
-                shared.append((result.group(2), IO[result.group(1).upper()]))
+                shared.append((result.group(2), io))
             else:
-                internal.append((portName, IO[result.group(1).upper()]))
+                internal.append((portName, io))
 
             if "UserCLK" in portName:
                 userClk = True
@@ -716,7 +805,7 @@ def _belMapProcessing(file: str, filename: str, syntax: Literal["vhdl", "verilog
             if bel == ['']:
                 continue
             # process enum data type
-            if bel[0] in list(belEnumsDic.keys()):
+            if bel[0] in belEnumsDic:
                 belMapDic[bel[0]] = belEnumsDic[bel[0]]
             # process vector input
             elif ":" in bel[1]:
@@ -756,7 +845,14 @@ def parseMatrix(fileName: str, tileName: str) -> Dict[str, List[str]]:
     Returns:
         Dict[str, List[str]]: dictionary from destination to a list of source
     """
+    # the same matrix is parsed for the fabric definition, the switch matrix, the bitstream specification and the
+    # models, so the result is reused as long as the file on disk is unchanged
+    connectionsDic = _parseMatrixCached(fileName, tileName)
+    return {k: v[:] for k, v in connectionsDic.items()}
 
+
+@cacheByFileVersion
+def _parseMatrixCached(fileName: str, tileName: str) -> Dict[str, List[str]]:
     connectionsDic = {}
     with open(fileName, 'r') as f:
         file = f.read()
@@ -808,9 +904,9 @@ def parseConfigMem(fileName: str, maxFramePerCol: int, frameBitPerRow: int, glob
         mappingFile = list(csv.DictReader(f))
 
         # remove the pretty print from used_bits_mask
-        for i, _ in enumerate(mappingFile):
-            mappingFile[i]["used_bits_mask"] = mappingFile[i]["used_bits_mask"].replace(
-                "_", "")
+        for entry in mappingFile:
+            entry["used_bits_mask"] = entry["used_bits_mask"].translate(
+                _DROP_US)
 
         # we should have as many lines as we have frames (=framePerCol)
         if len(mappingFile) != maxFramePerCol:
@@ -820,19 +916,21 @@ def parseConfigMem(fileName: str, maxFramePerCol: int, frameBitPerRow: int, glob
         # we also check used_bits_mask (is a vector that is as long as a frame and contains a '1' for a bit used and a '0' if not used (padded)
         usedBitsCounter = 0
         for entry in mappingFile:
-            if entry["used_bits_mask"].count("1") > frameBitPerRow:
+            usedBits = entry["used_bits_mask"].count("1")
+            if usedBits > frameBitPerRow:
                 raise ValueError(
                     f"bitstream mapping file {fileName} has to many 1-elements in bitmask for frame : {entry['frame_name']}")
             if len(entry["used_bits_mask"]) != frameBitPerRow:
                 raise ValueError(
                     f"bitstream mapping file {fileName} has has a too long or short bitmask for frame : {entry['frame_name']}")
-            usedBitsCounter += entry["used_bits_mask"].count("1")
+            usedBitsCounter += usedBits
 
         if usedBitsCounter != globalConfigBits:
             raise ValueError(
                 f"bitstream mapping file {fileName} has a bitmask miss match; bitmask has in total {usedBitsCounter} 1-values for {globalConfigBits} bits")
 
-        allConfigBitsOrder = []
+        # the config bits allocated by the previous frames, a set so the duplicate check is a hash lookup
+        allocatedConfigBits = set()
         configMemEntry = []
         for entry in mappingFile:
             configBitsOrder = []
@@ -850,14 +948,14 @@ def parseConfigMem(fileName: str, maxFramePerCol: int, frameBitPerRow: int, glob
                     numList = list(range(left, right + 1))
 
                 for i in numList:
-                    if i in allConfigBitsOrder:
+                    if i in allocatedConfigBits:
                         raise ValueError(
                             f"Configuration bit index {i} already allocated in {fileName}, {entry['frame_name']}")
                     configBitsOrder.append(i)
 
             elif ";" in entry["ConfigBits_ranges"]:
                 for item in entry["ConfigBits_ranges"].split(";"):
-                    if int(item) in allConfigBitsOrder:
+                    if int(item) in allocatedConfigBits:
                         raise ValueError(
                             f"Configuration bit index {item} already allocated in {fileName}, {entry['frame_name']}")
                     configBitsOrder.append(int(item))
@@ -869,7 +967,7 @@ def parseConfigMem(fileName: str, maxFramePerCol: int, frameBitPerRow: int, glob
                 raise ValueError(
                     f"Range {entry['ConfigBits_ranges']} is not a valid format. It should be in the form [int]:[int] or [int]. If there are multiple ranges it should be separated by ';'")
 
-            allConfigBitsOrder += configBitsOrder
+            allocatedConfigBits.update(configBitsOrder)
 
             if entry["used_bits_mask"].count("1") > 0:
                 configMemEntry.append(ConfigMem(frameName=entry["frame_name"],
@@ -22,8 +22,8 @@ def genVPRModel(fabric: Fabric, customXMLfile: str = "") -> str:
 
     allBelVariant: List[Bel] = []
     belName: set[str] = set()
-    allCustomXMLBelName = [i.get("name")
-                           for i in customXML.findall("bel_info")]
+    allCustomXMLBelName = {i.get("name")
+                           for i in customXML.findall("bel_info")}
     for name, tile in fabric.tileDic.items():
         for bel in tile.bels:
             if bel.name not in belName:
@@ -831,7 +831,7 @@ def genVPRModelXML(archObject: FabricModelGen, customXmlFilename, generatePairs=
     sourceSinkMap = getFabricSourcesAndSinks(archObject)
 
     # List to track bels that we've already created a pb_type for (by type)
-    doneBels = []
+    doneBels = set()
     for cellType in archObject.cellTypes:
         cTile = getTileByType(archObject, cellType)
 
@@ -1022,14 +1022,13 @@ def genVPRModelXML(archObject: FabricModelGen, customXmlFilename, generatePairs=
                 pb_typesString += pbPortsStr
                 pb_typesString += f'   </pb_type>\n'  # Close wrapper tag
 
-            doneBels.append(bel[0])  # Make sure we don't repeat similar BELs
+            doneBels.add(bel[0])  # Make sure we don't repeat similar BELs
 
         # Finally, we generate an extra sub_tile to contain all hanging sinks and sources (e.g. VCC, GND)
         # TODO: convert this to an individual sub_tile and pb_type for each kind of source/sink
         # This should allow GND and VCC sources to be instantiated or potentially techmapped
 
-        hangingSources = sourceSinkMap[cTile.genTileLoc()][0]
-        hangingSinks = sourceSinkMap[cTile.genTileLoc()][1]
+        hangingSources, hangingSinks = sourceSinkMap[cTile.genTileLoc()]
 
         # only do this if there actually are any hanging sources or sinks
         if not (len(hangingSources) == len(hangingSinks) == 0):
@@ -1342,29 +1341,31 @@ def genVPRModelRRGraph(archObject: FabricModelGen, generatePairs=True):
 
     for row in archObject.tiles:
         for tile in row:
+            # empty tiles have no clock input, wires or pips, so they are skipped before any work is done
+            if tile.tileType == "NULL":
+                continue
             tileLoc = tile.genTileLoc()
             # Generate clock nodes:
 
             # First, clock output:
-            if tile.tileType != "NULL":
-                # Add clock inputs for every tile:
-
-                # Generate tag for each node
-                nodesString += f'  <node id="{curNodeId}" type="IPIN" capacity="1">\n'
-                # Add loc tag
-                nodesString += f'   <loc xlow="{tile.x + 1}" ylow="{tile.y + 1}" xhigh="{tile.x + 1}" yhigh="{tile.y + 1}" ptc="0" side="BOTTOM"/>\n'
-                nodesString += '  </node>\n'  # Close node tag
-                # Add to dest map as equivalent to a wire destination
-                sourceToWireIDMap[tileLoc + ".UserCLK"] = curNodeId
-                curNodeId += 1
+            # Add clock inputs for every tile:
+
+            # Generate tag for each node
+            nodesString += f'  <node id="{curNodeId}" type="IPIN" capacity="1">\n'
+            # Add loc tag
+            nodesString += f'   <loc xlow="{tile.x + 1}" ylow="{tile.y + 1}" xhigh="{tile.x + 1}" yhigh="{tile.y + 1}" ptc="0" side="BOTTOM"/>\n'
+            nodesString += '  </node>\n'  # Close node tag
+            # Add to dest map as equivalent to a wire destination
+            sourceToWireIDMap[tileLoc + ".UserCLK"] = curNodeId
+            curNodeId += 1
 
-                # Generate tag for each node
-                nodesString += f'  <node id="{curNodeId}" type="SINK" capacity="1">\n'
-                # Add loc tag
-                nodesString += f'   <loc xlow="{tile.x + 1}" ylow="{tile.y + 1}" xhigh="{tile.x + 1}" yhigh="{tile.y + 1}" ptc="0"/>\n'
-                nodesString += '  </node>\n'  # Close node tag
-                IpinToSinkStr += f'  <edge src_node="{curNodeId - 1}" sink_node="{curNodeId}" switch_id="1"/>\n'
-                curNodeId += 1
+            # Generate tag for each node
+            nodesString += f'  <node id="{curNodeId}" type="SINK" capacity="1">\n'
+            # Add loc tag
+            nodesString += f'   <loc xlow="{tile.x + 1}" ylow="{tile.y + 1}" xhigh="{tile.x + 1}" yhigh="{tile.y + 1}" ptc="0"/>\n'
+            nodesString += '  </node>\n'  # Close node tag
+            IpinToSinkStr += f'  <edge src_node="{curNodeId - 1}" sink_node="{curNodeId}" switch_id="1"/>\n'
+            curNodeId += 1
 
             for wire in tile.wires:
                 # We want to find the length of the wire based on the x and y offset - either it's a jump, or in theory goes off in only one direction - let's find which
@@ -1439,24 +1440,24 @@ def genVPRModelRRGraph(archObject: FabricModelGen, generatePairs=True):
             # Generate nodes for atomic wires
             for wire in tile.atomicWires:
                 # We want to find the length of the wire based on the x and y offset - either it's a jump, or in theory goes off in only one direction - let's find which
-                if wire["yoffset"] != "0" and wire["xoffset"] != "0":
-                    print(wire["yoffset"], wire["xoffset"])
+                if wire.yoffset != 0 and wire.xoffset != 0:
+                    print(wire.yoffset, wire.xoffset)
                     # Stop if there are diagonal wires just in case they get put in a fabric
                     raise Exception(
                         "Diagonal wires not currently supported for VPR routing resource model")
                 # Then we check which one isn't zero and take that as the length
-                if wire["yoffset"] != "0":
+                if wire.yoffset != 0:
                     nodeType = "CHANY"  # Set node type as vertical channel if wire is vertical
-                elif wire["xoffset"] != "0":
+                elif wire.xoffset != 0:
                     nodeType = "CHANX"  # Set as horizontal if moving along X
 
                 # Generate location strings for the source and destination
-                wireSource = wire["sourceTile"] + "." + wire["source"]
-                wireDest = wire["destTile"] + "." + wire["destination"]
+                wireSource = wire.sourceTile + "." + wire.source
+                wireDest = wire.destTile + "." + wire.destination
 
-                destTile = archObject.getTileByLoc(wire["destTile"])
+                destTile = archObject.getTileByLoc(wire.destTile)
 
-                if (nodeType == "CHANX" and int(wire["xoffset"]) > 0) or (nodeType == "CHANY" and int(wire["yoffset"]) > 0):
+                if (nodeType == "CHANX" and wire.xoffset > 0) or (nodeType == "CHANY" and wire.yoffset > 0):
                     direction = "INC_DIR"
                     yLow = tile.y
                     xLow = tile.x
@@ -1552,10 +1553,10 @@ def genVPRModelRRGraph(archObject: FabricModelGen, generatePairs=True):
                     srcToOpinStr += f'  <edge src_node="{curNodeId}" sink_node="{curNodeId - 1}" switch_id="1"/>\n'
                     curNodeId += 1  # Increment id so all nodes have different ids
 
-            for source in sourceSinkMap[tile.genTileLoc()][0]:
+            for source in sourceSinkMap[tileLoc][0]:
                 thisPtc = ptcMap[tile.tileType][source]
 
-                nodesString += f'  <!-- Source: {tile.genTileLoc()}.{source} -->\n'
+                nodesString += f'  <!-- Source: {tileLoc}.{source} -->\n'
 
                 # Generate tag for each node
                 nodesString += f'  <node id="{curNodeId}" type="SOURCE" capacity="1">\n'
@@ -1576,10 +1577,10 @@ def genVPRModelRRGraph(archObject: FabricModelGen, generatePairs=True):
 
                 curNodeId += 1
 
-            for sink in sourceSinkMap[tile.genTileLoc()][1]:
+            for sink in sourceSinkMap[tileLoc][1]:
                 thisPtc = ptcMap[tile.tileType][sink]
 
-                nodesString += f'  <!-- Sink: {tile.genTileLoc()}.{sink} -->\n'
+                nodesString += f'  <!-- Sink: {tileLoc}.{sink} -->\n'
 
                 # Generate tag for each node
                 nodesString += f'  <node id="{curNodeId}" type="SINK" capacity="1">\n'
@@ -1609,9 +1610,11 @@ def genVPRModelRRGraph(archObject: FabricModelGen, generatePairs=True):
 
     for row in archObject.tiles:
         for tile in row:
-            if tile.tileType != "NULL":  # If the tile isn't NULL then create an edge for the clock primitive connection
-                tileLoc = tile.genTileLoc()
-                edgeStr += f'  <edge src_node="{destToWireIDMap[clockLoc + "." + "clock_out"]}" sink_node="{sourceToWireIDMap[tileLoc + ".UserCLK"]}" switch_id="1"/>\n'
+            # empty tiles have neither a clock primitive connection nor pips
+            if tile.tileType == "NULL":
+                continue
+            tileLoc = tile.genTileLoc()
+            edgeStr += f'  <edge src_node="{destToWireIDMap[clockLoc + "." + "clock_out"]}" sink_node="{sourceToWireIDMap[tileLoc + ".UserCLK"]}" switch_id="1"/>\n'
 
             for pip in tile.pips:  # Find source and sink name
                 src_name = tileLoc + "." + pip[0]
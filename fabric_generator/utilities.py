@@ -1,4 +1,11 @@
 import re
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
+from typing import List, NamedTuple, Optional, Tuple
+
+from fabric_generator.file_parser import cacheByFileVersion
 
 # Default parameters (will be overwritten if defined in fabric between 'ParametersBegin' and 'ParametersEnd'
 #Parameters = [ 'ConfigBitMode', 'FrameBitsPerRow' ]
@@ -48,22 +55,41 @@ GNDRE = re.compile("GND(\d*)")
 VCCRE = re.compile("VCC(\d*)")
 VDDRE = re.compile("VDD(\d*)")
 BracketAddingRE = re.compile(r"^(\S+?)(\d+)$")
+# port declaration cleanup: drop everything from the first ',', ';' or comment marker, then all blanks
+_VHDL_PORT_TAIL_RE = re.compile(r"[,;].*|--.*")
+_VERILOG_PORT_TAIL_RE = re.compile(r"[,;].*|//.*")
+_STRIP_BLANKS = str.maketrans("", "", " \t")
+# the wire directions of a tile description, for membership tests
+_WIRE_DIRECTIONS = frozenset(All_Directions)
+# port parsing patterns, compiled once as they are applied to every line of every BEL file
+_ENTITY_RE = re.compile('^entity', re.IGNORECASE)
+_DIRECTION_RES = tuple((d, re.compile(d, re.IGNORECASE)) for d in All_Directions)
+_VHDL_GLOBAL_RE = re.compile('-- global', re.IGNORECASE)
+_STD_LOGIC_VECTOR_RE = re.compile('.*std_logic_vector', re.IGNORECASE)
+_STD_LOGIC_RE = re.compile('STD_LOGIC.*', re.IGNORECASE)
+_PORT_IN_RE = re.compile(':in.*', re.IGNORECASE)
+_PORT_OUT_RE = re.compile(':out.*', re.IGNORECASE)
+_PORT_RE = re.compile('port', re.IGNORECASE)
+_MODULE_RE = re.compile('^module', re.IGNORECASE)
+# the entity or module name is what is left of the declaration line without the keyword, its tail and blanks
+_ENTITY_TAIL_RE = re.compile(' is.*', re.IGNORECASE)
+_ENTITY_KEYWORD_RE = re.compile('entity', re.IGNORECASE)
+_MODULE_TAIL_RE = re.compile(r' \(.*', re.IGNORECASE)
+_MODULE_KEYWORD_RE = re.compile('module', re.IGNORECASE)
+_VERILOG_GLOBAL_RE = re.compile('// global', re.IGNORECASE)
+_VERILOG_PORT_IO_RE = re.compile('input|output', re.IGNORECASE)
+_PORT_INDEX_RE = re.compile(r" *\(.*\) *")
+_NO_CONFIG_BITS_RE = re.compile(r"NoConfigBits\s*:\s*integer\s*:=\s*(\w+)", re.IGNORECASE)
+_NUMBER_OF_CONFIG_BITS_RE = re.compile('NumberOfConfigBits', re.IGNORECASE)
+_NO_NUMBER_OF_CONFIG_BITS_RE = re.compile('NumberOfConfigBits:0', re.IGNORECASE)
 letters = ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M",
            "N", "O", "P", "Q", "R", "S", "T", "U", "V", "W"]  # For LUT labelling
 
 
 # Given a fabric array description, return all uniq cell types
 def GetCellTypes(list):
-    # make the fabric flat
-    flat_list = []
-    for sublist in list:
-        for item in sublist:
-            flat_list.append(item)
-
-    output = []
-    for item in flat_list:
-        if item not in output:
-            output.append(item)
+    # dict keys keep the first-seen order while deduplicating in one pass over the flat fabric
+    output = [*dict.fromkeys(item for sublist in list for item in sublist)]
 
     # we use the keyword 'NULL' for padding tiles that we don't return
     if ('NULL' in output):
@@ -101,7 +127,9 @@ def GetFabric(list, filter='Fabric'):
         if filter+'End' in sublist:            # was FabricEnd
             marker = False
         if marker == True:
-            templist.append(sublist)
+            # the tile type names are compared against each other and against 'NULL' all over the generators,
+            # interning them lets most of these == checks take the identity fast path
+            templist.append([sys.intern(cell) for cell in sublist])
         # we place this conditional after the append such that the 'FabricBegin' will be kicked out
         if filter+'Begin' in sublist:        # was FabricBegin
             marker = True
@@ -148,119 +176,113 @@ def GetSuperTileFromFile(list):
 
 
 def PrintTileComponentPort(tile_description, entity, direction, file):
-    print('\t-- ', direction, file=file)
-    for line in tile_description:
-        if line[0] == direction:
-            print('\t\t', line[source_name],
-                  '\t: out \tSTD_LOGIC_VECTOR( ', end='', file=file)
-            print(((abs(int(line[X_offset]))+abs(int(line[Y_offset])))
-                  * int(line[wires]))-1, end='', file=file)
-            print(' downto 0 );', end='', file=file)
-            print('\t -- wires: ', line[wires], file=file)
-    for line in tile_description:
-        if line[0] == direction:
-            print('\t\t', line[destination_name],
-                  '\t: in \tSTD_LOGIC_VECTOR( ', end='', file=file)
-            print(((abs(int(line[X_offset]))+abs(int(line[Y_offset])))
-                  * int(line[wires]))-1, end='', file=file)
-            print(' downto 0 );', end='', file=file)
-            print('\t -- wires: ', line[wires], file=file)
+    # the port declarations are collected and written in one go instead of printing them piece by piece
+    lines = [f'\t--  {direction}\n']
+    for inOut, name in (('out', source_name), ('in', destination_name)):
+        for line in tile_description:
+            if line[0] == direction:
+                width = (abs(int(line[X_offset]))+abs(int(line[Y_offset]))) * int(line[wires])
+                lines.append(f'\t\t {line[name]} \t: {inOut} \tSTD_LOGIC_VECTOR( {width-1} downto 0 );'
+                             f'\t -- wires:  {line[wires]}\n')
+    file.write(''.join(lines))
     return
 
 
 def replace(string, substitutions):
-    substrings = sorted(substitutions, key=len, reverse=True)
-    regex = re.compile('|'.join(map(re.escape, substrings)))
+    # single character substitutions, like stripping blanks, are done in one pass with a translation table
+    if all(len(substring) == 1 for substring in substitutions):
+        return string.translate(str.maketrans(substitutions))
+    regex = _substitutionRegex(tuple(substitutions))
     return regex.sub(lambda match: substitutions[match.group(0)], string)
 
 
+# the longest substrings are tried first, the pattern is compiled once for each set of substrings
+@lru_cache(maxsize=None)
+def _substitutionRegex(substrings):
+    substrings = sorted(substrings, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, substrings)))
+
+
 def GetComponentPortsFromFile(VHDL_file_name, filter='ALL', port='internal', BEL_Prefix=''):
-    VHDLfile = [line.rstrip('\n')
-                for line in open(f"{src_dir}/{VHDL_file_name}")]
+    # the same BEL files are queried for every tile and for every port kind, so the file is parsed once
+    # into (direction, kind, port) entries and each query only filters those
+    fileName = f"{src_dir}/{VHDL_file_name}"
+    ports = [(kind, BEL_Prefix+name) for direction, kind, name
+             in _parseComponentPorts(fileName)
+             if direction == filter or filter == 'ALL']
+    if port == 'internal':             # default
+        return [name for kind, name in ports if kind == 'in'], [name for kind, name in ports if kind == 'out']
+    else:
+        return [name for kind, name in ports if kind == port]
 
-    Inputs = []
-    Outputs = []
-    ExternalPorts = []
+
+@cacheByFileVersion
+def _parseComponentPorts(fileName):
+    VHDLfile = [line.rstrip('\n') for line in open(fileName)]
+
+    ports = []
     marker = False
     FoundEntityMarker = False
     DoneMarker = False
     direction = ''
     for line in VHDLfile:
         # the order of the if-statements are important ;
-        if re.search('^entity', line, flags=re.IGNORECASE):
+        if _ENTITY_RE.search(line):
             FoundEntityMarker = True
 
         # detect the direction from comments, like "--NORTH"
         # we need this to filter for a specific direction
         # this implies of course that this information is provided in the VHDL entity
-        if re.search('NORTH', line, flags=re.IGNORECASE):
-            direction = 'NORTH'
-        if re.search('EAST', line, flags=re.IGNORECASE):
-            direction = 'EAST'
-        if re.search('SOUTH', line, flags=re.IGNORECASE):
-            direction = 'SOUTH'
-        if re.search('WEST', line, flags=re.IGNORECASE):
-            direction = 'WEST'
+        for d, directionRE in _DIRECTION_RES:
+            if directionRE.search(line):
+                direction = d
 
         # all primitive pins that are connected to the switch matrix have to go before the GLOBAL label
-        if re.search('-- global', line, flags=re.IGNORECASE):
+        if _VHDL_GLOBAL_RE.search(line):
             FoundEntityMarker = False
             marker = False
             DoneMarker = True
 
-        if (marker == True) and (DoneMarker == False) and (direction == filter or filter == 'ALL'):
+        if (marker == True) and (DoneMarker == False):
             # detect if the port has to be exported as EXTERNAL which is flagged by the comment
-            if re.search('EXTERNAL', line):
-                External = True
-            else:
-                External = False
-            if re.search('CONFIG_PORT', line):
-                Config = True
-            else:
-                Config = False
+            External = 'EXTERNAL' in line
+            Config = 'CONFIG_PORT' in line
             # get rid of everything with and after the ';' that will also remove comments
             # substitutions = {';.*', '', '--.*', '', ',.*', ''}
             # tmp_line=(replace(line, substitutions))
             # tmp_line = (re.sub(';.*', '',(re.sub('--.*', '',line, flags=re.IGNORECASE)), flags=re.IGNORECASE))
-            tmp_line = (re.sub(';.*', '', (re.sub('--.*', '', (re.sub(',.*', '', line,
-                        flags=re.IGNORECASE)), flags=re.IGNORECASE)), flags=re.IGNORECASE))
+            tmp_line = _VHDL_PORT_TAIL_RE.sub('', line, count=1)
             std_vector = ''
-            if re.search('std_logic_vector', tmp_line, flags=re.IGNORECASE):
-                std_vector = (re.sub('.*std_logic_vector', '',
-                              tmp_line, flags=re.IGNORECASE))
-            tmp_line = (re.sub('STD_LOGIC.*', '',
-                        tmp_line, flags=re.IGNORECASE))
-
-            substitutions = {" ": "", "\t": ""}
-            tmp_line = (replace(tmp_line, substitutions))
+            if _STD_LOGIC_VECTOR_RE.search(tmp_line):
+                std_vector = _STD_LOGIC_VECTOR_RE.sub('', tmp_line)
+            tmp_line = _STD_LOGIC_RE.sub('', tmp_line)
+
+            tmp_line = tmp_line.translate(_STRIP_BLANKS)
             # at this point, we get clean port names, like
             # A0:in
             # A1:in
             # A2:in
             # The following is for internal fabric signal ports (e.g., a CLB/LUT)
-            if (port == 'internal') and (External == False) and (Config == False):
-                if re.search(':in', tmp_line, flags=re.IGNORECASE):
-                    Inputs.append(
-                        BEL_Prefix+(re.sub(':in.*', '', tmp_line, flags=re.IGNORECASE))+std_vector)
-                if re.search(':out', tmp_line, flags=re.IGNORECASE):
-                    Outputs.append(
-                        BEL_Prefix+(re.sub(':out.*', '', tmp_line, flags=re.IGNORECASE))+std_vector)
+            if (External == False) and (Config == False):
+                if _PORT_IN_RE.search(tmp_line):
+                    ports.append(
+                        (direction, 'in', _PORT_IN_RE.sub('', tmp_line)+std_vector))
+                if _PORT_OUT_RE.search(tmp_line):
+                    ports.append(
+                        (direction, 'out', _PORT_OUT_RE.sub('', tmp_line)+std_vector))
             # The following is for ports that have to go all the way up to the top-level entity (e.g., from an I/O cell)
-            if (port == 'external') and (External == True):
+            if External == True:
                 # .lstrip() removes leading white spaces including ' ', '\t'
-                ExternalPorts.append(BEL_Prefix+line.lstrip())
+                ports.append((direction, 'external', line.lstrip()))
 
             # frame reconfiguration needs a port for writing in frame data
-            if (port == 'frame_config') and (Config == True):
+            if Config == True:
                 # .lstrip() removes leading white spaces including ' ', '\t'
-                ExternalPorts.append(BEL_Prefix+line.lstrip())
+                ports.append((direction, 'frame_config', line.lstrip()))
 
-        if re.search('port', line, flags=re.IGNORECASE):
+        if _PORT_RE.search(line):
             marker = True
-    if port == 'internal':             # default
-        return Inputs, Outputs
-    else:
-        return ExternalPorts
+    return tuple(ports)
 
 
 def GetComponentPortsFromVerilog(Verilog_file_name, filter='ALL', port='internal', BEL_Prefix=''):
@@ -274,64 +296,49 @@ def GetComponentPortsFromVerilog(Verilog_file_name, filter='ALL', port='internal
     direction = ''
     for line in Verilogfile:
         # the order of the if-statements are important ;
-        if re.search('^module', line, flags=re.IGNORECASE):
+        if _MODULE_RE.search(line):
             FoundEntityMarker = True
 
         # detect the direction from comments, like "--NORTH"
         # we need this to filter for a specific direction
         # this implies of course that this information is provided in the VHDL entity
-        if re.search('NORTH', line, flags=re.IGNORECASE):
-            direction = 'NORTH'
-        if re.search('EAST', line, flags=re.IGNORECASE):
-            direction = 'EAST'
-        if re.search('SOUTH', line, flags=re.IGNORECASE):
-            direction = 'SOUTH'
-        if re.search('WEST', line, flags=re.IGNORECASE):
-            direction = 'WEST'
+        for d, directionRE in _DIRECTION_RES:
+            if directionRE.search(line):
+                direction = d
 
         # all primitive pins that are connected to the switch matrix have to go before the GLOBAL label
-        if re.search('// global', line, flags=re.IGNORECASE):
+        if _VERILOG_GLOBAL_RE.search(line):
             FoundEntityMarker = False
             marker = False
             DoneMarker = True
 
         if (marker == True) and (DoneMarker == False) and (direction == filter or filter == 'ALL'):
             # detect if the port has to be exported as EXTERNAL which is flagged by the comment
-            if re.search('EXTERNAL', line):
-                External = True
-            else:
-                External = False
-            if re.search('CONFIG_PORT', line):
-                Config = True
-            else:
-                Config = False
+            External = 'EXTERNAL' in line
+            Config = 'CONFIG_PORT' in line
             # get rid of everything with and after the ';' that will also remove comments
             # substitutions = {';.*', '', '--.*', '', ',.*', ''}
             # tmp_line=(replace(line, substitutions))
             # tmp_line = (re.sub(';.*', '',(re.sub('--.*', '',line, flags=re.IGNORECASE)), flags=re.IGNORECASE))
-            tmp_line = (re.sub(';.*', '', (re.sub('//.*', '', (re.sub(',.*', '', line,
-                        flags=re.IGNORECASE)), flags=re.IGNORECASE)), flags=re.IGNORECASE))
+            tmp_line = _VERILOG_PORT_TAIL_RE.sub('', line, count=1)
             std_vector = ''
-            if re.search('input', tmp_line, flags=re.IGNORECASE) or re.search('output', tmp_line, flags=re.IGNORECASE):
-                std_vector = (re.sub('.*std_logic_vector', '',
-                              tmp_line, flags=re.IGNORECASE))
-            tmp_line = (re.sub('STD_LOGIC.*', '',
-                        tmp_line, flags=re.IGNORECASE))
-
-            substitutions = {" ": "", "\t": ""}
-            tmp_line = (replace(tmp_line, substitutions))
+            if _VERILOG_PORT_IO_RE.search(tmp_line):
+                std_vector = _STD_LOGIC_VECTOR_RE.sub('', tmp_line)
+            tmp_line = _STD_LOGIC_RE.sub('', tmp_line)
+
+            tmp_line = tmp_line.translate(_STRIP_BLANKS)
             # at this point, we get clean port names, like
             # A0:in
             # A1:in
             # A2:in
             # The following is for internal fabric signal ports (e.g., a CLB/LUT)
             if (port == 'internal') and (External == False) and (Config == False):
-                if re.search(':in', tmp_line, flags=re.IGNORECASE) and 'integer' not in tmp_line:
+                if _PORT_IN_RE.search(tmp_line) and 'integer' not in tmp_line:
                     Inputs.append(
-                        BEL_Prefix+(re.sub(':in.*', '', tmp_line, flags=re.IGNORECASE))+std_vector)
-                if re.search(':out', tmp_line, flags=re.IGNORECASE):
+                        BEL_Prefix+_PORT_IN_RE.sub('', tmp_line)+std_vector)
+                if _PORT_OUT_RE.search(tmp_line):
                     Outputs.append(
-                        BEL_Prefix+(re.sub(':out.*', '', tmp_line, flags=re.IGNORECASE))+std_vector)
+                        BEL_Prefix+_PORT_OUT_RE.sub('', tmp_line)+std_vector)
             # The following is for ports that have to go all the way up to the top-level entity (e.g., from an I/O cell)
             if (port == 'external') and (External == True):
                 # .lstrip() removes leading white spaces including ' ', '\t'
@@ -342,7 +349,7 @@ def GetComponentPortsFromVerilog(Verilog_file_name, filter='ALL', port='internal
                 # .lstrip() removes leading white spaces including ' ', '\t'
                 ExternalPorts.append(BEL_Prefix+line.lstrip())
 
-        if re.search('port', line, flags=re.IGNORECASE):
+        if _PORT_RE.search(line):
             marker = True
     if port == 'internal':             # default
         return Inputs, Outputs
@@ -351,10 +358,14 @@ def GetComponentPortsFromVerilog(Verilog_file_name, filter='ALL', port='internal
 
 
 def GetNoConfigBitsFromFile(VHDL_file_name):
+    return _getNoConfigBitsCached(VHDL_file_name)
+
+
+@cacheByFileVersion
+def _getNoConfigBitsCached(VHDL_file_name):
     with open(VHDL_file_name, 'r') as f:
         file = f.read()
-    result = re.search(
-        r"NoConfigBits\s*:\s*integer\s*:=\s*(\w+)", file, flags=re.IGNORECASE)
+    result = _NO_CONFIG_BITS_RE.search(file)
     if result:
         try:
             return int(result.group(1))
@@ -363,24 +374,34 @@ def GetNoConfigBitsFromFile(VHDL_file_name):
 
 
 def GetComponentEntityNameFromFile(VHDL_file_name):
-    VHDLfile = [line.rstrip('\n')
-                for line in open(f"{src_dir}/{VHDL_file_name}")]
+    fileName = f"{src_dir}/{VHDL_file_name}"
+    return _getComponentEntityNameCached(fileName)
+
+
+@cacheByFileVersion
+def _getComponentEntityNameCached(fileName):
+    VHDLfile = [line.rstrip('\n') for line in open(fileName)]
     for line in VHDLfile:
         # the order of the if-statements is important
-        if re.search('^entity', line, flags=re.IGNORECASE):
-            result = (re.sub(' ', '', (re.sub('entity', '', (re.sub(
-                ' is.*', '', line, flags=re.IGNORECASE)), flags=re.IGNORECASE))))
+        if _ENTITY_RE.search(line):
+            result = _ENTITY_KEYWORD_RE.sub(
+                '', _ENTITY_TAIL_RE.sub('', line)).replace(' ', '')
     return result
 
 
 def GetComponentEntityNameFromVerilog(Verilog_file_name):
-    Verilogfile = [line.rstrip('\n') for line in open(
-        f"{src_dir}/{Verilog_file_name}")]
+    fileName = f"{src_dir}/{Verilog_file_name}"
+    return _getComponentEntityNameFromVerilogCached(fileName)
+
+
+@cacheByFileVersion
+def _getComponentEntityNameFromVerilogCached(fileName):
+    Verilogfile = [line.rstrip('\n') for line in open(fileName)]
     for line in Verilogfile:
         # the order of the if-statements is important
-        if re.search('^module', line, flags=re.IGNORECASE):
-            result = (re.sub(' ', '', (re.sub('module', '', (re.sub(
-                ' (.*', '', line, flags=re.IGNORECASE)), flags=re.IGNORECASE))))
+        if _MODULE_RE.search(line):
+            result = _MODULE_KEYWORD_RE.sub(
+                '', _MODULE_TAIL_RE.sub('', line)).replace(' ', '')
     return result
 
 
@@ -393,7 +414,7 @@ def GetTileComponentPorts(tile_description, mode='SwitchMatrix'):
         OpenIndex = '('
         CloseIndex = ')'
     for line in tile_description:
-        if (line[direction] == 'NORTH') or (line[direction] == 'EAST') or (line[direction] == 'SOUTH') or (line[direction] == 'WEST'):
+        if line[direction] in _WIRE_DIRECTIONS:
             # range (wires-1 downto 0) as connected to the switch matrix
             if mode in ['SwitchMatrix', 'SwitchMatrixIndexed']:
                 ThisRange = int(line[wires])
@@ -438,7 +459,7 @@ def GetTileComponentPortsVectors(tile_description, mode):
     Outputs = []
     MaxIndex = 0
     for line in tile_description:
-        if (line[direction] == 'NORTH') or (line[direction] == 'EAST') or (line[direction] == 'SOUTH') or (line[direction] == 'WEST'):
+        if line[direction] in _WIRE_DIRECTIONS:
             # range (wires-1 downto 0) as connected to the switch matrix
             if mode in ['SwitchMatrix', 'SwitchMatrixIndexed']:
                 MaxIndex = int(line[wires])
@@ -491,8 +512,8 @@ def PrintCSV_FileInfo(CSV_FileName):
 
 def ExpandListPorts(port, PortList):
     # a leading '[' tells us that we have to expand the list
-    if re.search('\[', port):
-        if not re.search('\]', port):
+    if '[' in port:
+        if ']' not in port:
             raise ValueError(
                 '\nError in function ExpandListPorts: cannot find closing ]\n')
         # port.find gives us the first occurrence index in a string
@@ -502,7 +523,7 @@ def ExpandListPorts(port, PortList):
         # right_index is the position of the ']' so we need everything after that
         after_right_index = port[(right_index+1):]
         ExpandList = []
-        ExpandList = re.split('\|', port[left_index+1:right_index])
+        ExpandList = port[left_index+1:right_index].split('|')
         for entry in ExpandList:
             ExpandListItem = (before_left_index+entry+after_right_index)
             ExpandListPorts(ExpandListItem, PortList)
@@ -513,12 +534,6 @@ def ExpandListPorts(port, PortList):
     return
 
 
-def takes_list(a_string, a_list):
-    print('first debug (a_list):', a_list, 'string:', a_string)
-    for item in a_list:
-        print('hello debug:', item, 'string:', a_string)
-
-
 def GetVerilogDeclarationForFile(VHDL_file_name):
     ConfigPortUsed = 0  # 1 means is used
     VHDLfile = [line.rstrip('\n')
@@ -528,16 +543,28 @@ def GetVerilogDeclarationForFile(VHDL_file_name):
     # print(item)
     for line in VHDLfile:
         # NumberOfConfigBits:0 means no configuration port
-        if re.search('NumberOfConfigBits', line, flags=re.IGNORECASE):
+        if _NUMBER_OF_CONFIG_BITS_RE.search(line):
             # NumberOfConfigBits appears, so we may have a config port
             ConfigPortUsed = 1
             # but only if the following is not true
-            if re.search('NumberOfConfigBits:0', line, flags=re.IGNORECASE):
+            if _NO_NUMBER_OF_CONFIG_BITS_RE.search(line):
                 ConfigPortUsed = 0
     # print('', file=file)
     return ConfigPortUsed
 
 
+# A single wire between two neighbouring tiles, cascaded wires are split into these. The offsets are already converted
+# to integers
+class AtomicWire(NamedTuple):
+    direction: str
+    source: str
+    xoffset: int
+    yoffset: int
+    destination: str
+    sourceTile: str
+    destTile: str
+
+
 # This class represents individual tiles in the architecture
 class TileModelGen:
     tileType = ""
@@ -561,8 +588,8 @@ class TileModelGen:
 
     def genTileLoc(self, separate=False):
         if (separate):
-            return("X" + str(self.x), "Y" + str(self.y))
-        return "X" + str(self.x) + "Y" + str(self.y)
+            return (f"X{self.x}", f"Y{self.y}")
+        return f"X{self.x}Y{self.y}"
 
 
 # This class represents the fabric as a whole
@@ -571,46 +598,67 @@ class FabricModelGen:
     height = 0
     width = 0
     cellTypes = []
+    # The tiles indexed by their coordinates and by their location string, built on the first lookup.
+    # indexTiles has to be called again when the tiles are changed after that.
+    tilesByCoords = None
+    tilesByLoc = None
+    # The wires indexed by their destination tile location and indexed destination port, with and without the JUMP
+    # wires. Built on the first lookup, indexWireDestinations has to be called again when the wires change after that.
+    wiresByDest = None
+    wiresByDestNoJumps = None
 
     def __init__(self, inHeight, inWidth):
         self.width = inWidth
         self.height = inHeight
 
-    def getTileByCoords(self, x: int, y: int):
+    def indexTiles(self):
+        self.tilesByCoords = {}
+        self.tilesByLoc = {}
+        # the first tile found scanning the fabric row by row wins, as with the former linear search
         for row in self.tiles:
             for tile in row:
-                if tile.x == x and tile.y == y:
-                    return tile
+                self.tilesByCoords.setdefault((tile.x, tile.y), tile)
+                self.tilesByLoc.setdefault(tile.genTileLoc(), tile)
+
+    def getTileByCoords(self, x: int, y: int):
+        if self.tilesByCoords is None:
+            self.indexTiles()
+        return self.tilesByCoords.get((x, y))
         # raise ValueError(f"{x}, {y} is not a valid tile coordinate")
 
     def getTileByLoc(self, loc: str):
-        for row in self.tiles:
-            for tile in row:
-                if tile.genTileLoc() == loc:
-                    return tile
-        return None
-
-    def getTileAndWireByWireDest(self, loc: str, dest: str, jumps: bool = True):
+        if self.tilesByLoc is None:
+            self.indexTiles()
+        return self.tilesByLoc.get(loc)
+
+    def indexWireDestinations(self):
+        self.wiresByDest = {}
+        self.wiresByDestNoJumps = {}
+        # the first wire found in scanning order wins, as with the former linear search
         for row in self.tiles:
             for tile in row:
                 for wire in tile.wires:
-                    if not jumps:
-                        if wire["direction"] == "JUMP":
-                            continue
+                    destLoc = f"X{tile.x + int(wire['xoffset'])}Y{tile.y + int(wire['yoffset'])}"
+                    isJump = wire["direction"] == "JUMP"
                     for i in range(int(wire["wire-count"])):
-                        desty = tile.y + int(wire["yoffset"])
-                        destx = tile.x + int(wire["xoffset"])
-                        desttileLoc = f"X{destx}Y{desty}"
-                        if (desttileLoc == loc) and (wire["destination"] + str(i) == dest):
-                            return (tile, wire, i)
-        return None
+                        key = (destLoc, wire["destination"] + str(i))
+                        self.wiresByDest.setdefault(key, (tile, wire, i))
+                        if not isJump:
+                            self.wiresByDestNoJumps.setdefault(key, (tile, wire, i))
+
+    def getTileAndWireByWireDest(self, loc: str, dest: str, jumps: bool = True):
+        if self.wiresByDest is None:
+            self.indexWireDestinations()
+        if jumps:
+            return self.wiresByDest.get((loc, dest))
+        return self.wiresByDestNoJumps.get((loc, dest))
 
 
 # Method to add square brackets for wire pair generation (to account for different reference styles)
 def addBrackets(portIn: str, tile: TileModelGen):
     BracketMatch = BracketAddingRE.match(portIn)
     if BracketMatch and portIn not in tile.belPorts:
-        return BracketMatch.group(1) + "[" + BracketMatch.group(2) + "]"
+        return f"{BracketMatch.group(1)}[{BracketMatch.group(2)}]"
     else:
         return portIn
 
@@ -627,44 +675,47 @@ def getTileByType(fabricObject: FabricModelGen, cellType: str):
 # This function parses the contents of a CSV with comments removed to get where potential interconnects are
 # The current implementation has two potential outputs: pips is a list of pairings (designed for single PIPs), whereas pipsdict maps each source to all possible sinks (designed with multiplexers in mind)
 def findPipList(csvFile: list, returnDict: bool = False, mapSourceToSinks: bool = False):
+    pips, sourceToSinks, sinkToSources = findPipListAll(csvFile)
+    if returnDict:
+        if mapSourceToSinks:
+            return sourceToSinks
+        return sinkToSources
+    return pips
+
+
+# Find the pips of a switch matrix together with the maps from each source to its sinks and from each sink to its
+# sources, as findPipList does one at a time, in a single pass over the matrix
+def findPipListAll(csvFile: list):
     sinks = [line[0] for line in csvFile]
     sources = csvFile[0]
     pips = []
-    pipsdict = {}
+    sourceToSinks = defaultdict(list)
+    sinkToSources = defaultdict(list)
     for y, row in enumerate(csvFile[1::]):
         for x, value in enumerate(row[1::]):
             # Remember that x and y are offset
             if value == "1":
-                pips.append([sources[x+1], sinks[y+1]])
-                if mapSourceToSinks:
-                    if sources[x+1] in pipsdict.keys():
-                        pipsdict[sources[x+1]].append(sinks[y+1])
-                    else:
-                        pipsdict[sources[x+1]] = [sinks[y+1]]
-                else:
-                    if sinks[y+1] in pipsdict.keys():
-                        pipsdict[sinks[y+1]].append(sources[x+1])
-                    else:
-                        pipsdict[sinks[y+1]] = [sources[x+1]]
-    if returnDict:
-        return pipsdict
-    return pips
+                source, sink = sources[x+1], sinks[y+1]
+                pips.append([source, sink])
+                sourceToSinks[source].append(sink)
+                sinkToSources[sink].append(source)
+    # plain dicts again, the model generators rely on missing ports raising KeyError
+    return pips, dict(sourceToSinks), dict(sinkToSources)
 
 
-# Method to remove a known prefix from a string if it is present at the start - this is provided as str.removeprefix in Python 3.9 but has been implemented for compatibility
+# Method to remove a known prefix from a string if it is present at the start - FABulous needs Python 3.9 or above,
+# so this is str.removeprefix and only kept for the existing callers
 def removeStringPrefix(mainStr: str, prefix: str):
-    if mainStr[0:len(prefix)] == prefix:
-        return mainStr[len(prefix):]
-    else:
-        return mainStr
+    return mainStr.removeprefix(prefix)
 
 
 # Method to find all 'hanging' sources and sinks in a fabric (i.e. ports with connections to pips in only one direction e.g. VCC, GND)
 # Returns dict mapping tileLoc to hanging pins
 def getFabricSourcesAndSinks(archObject: FabricModelGen, assumeSourceSinkNames=True):
     # First, build a list of all fabric inputs/outputs (bel ports and wires) with the tile address
-    allFabricInputs = []
-    allFabricOutputs = []
+    # sets, since every pip of every tile is checked against them
+    allFabricInputs = set()
+    allFabricOutputs = set()
     returnDict = {}
 
     if not assumeSourceSinkNames:
@@ -673,10 +724,10 @@ def getFabricSourcesAndSinks(archObject: FabricModelGen, assumeSourceSinkNames=T
                 tileLoc = tile.genTileLoc()
 
                 for bel in tile.belsWithIO:
-                    allFabricInputs.extend(
-                        [(tileLoc + "." + cInput) for cInput in bel[2]])
-                    allFabricOutputs.extend(
-                        [(tileLoc + "." + cOutput) for cOutput in bel[3]])
+                    allFabricInputs.update(
+                        f"{tileLoc}.{cInput}" for cInput in bel[2])
+                    allFabricOutputs.update(
+                        f"{tileLoc}.{cOutput}" for cOutput in bel[3])
 
                 for wire in tile.wires:
                     # Calculate destination location of the wire at hand
@@ -686,38 +737,221 @@ def getFabricSourcesAndSinks(archObject: FabricModelGen, assumeSourceSinkNames=T
 
                     # For every individual wire
                     for i in range(int(wire["wire-count"])):
-                        allFabricInputs.append(
-                            tileLoc + "." + wire["source"] + str(i))
-                        allFabricOutputs.append(
-                            desttileLoc + "." + wire["destination"] + str(i))
+                        allFabricInputs.add(
+                            f"{tileLoc}.{wire['source']}{i}")
+                        allFabricOutputs.add(
+                            f"{desttileLoc}.{wire['destination']}{i}")
 
                 for wire in tile.atomicWires:
                     # Generate location strings for the source and destination
-                    allFabricInputs.append(
-                        wire["sourceTile"] + "." + wire["source"])
-                    allFabricOutputs.append(
-                        wire["destTile"] + "." + wire["destination"])
+                    allFabricInputs.add(
+                        f"{wire.sourceTile}.{wire.source}")
+                    allFabricOutputs.add(
+                        f"{wire.destTile}.{wire.destination}")
+
+    # the GND and VCC sources of each tile type, used when the source and sink names are assumed
+    supplySources = {}
 
     # Now we go through all the pips, and if a source/sink doesn't appear in the list we keep it
     for row in archObject.tiles:
         for tile in row:
             tileLoc = tile.genTileLoc()
+            if assumeSourceSinkNames:
+                if tile.tileType not in supplySources:
+                    supplySources[tile.tileType] = {pip[0] for pip in tile.pips
+                                                    if GNDRE.match(pip[0]) or VCCRE.match(pip[0]) or VDDRE.match(pip[0])}
+                returnDict[tileLoc] = (set(supplySources[tile.tileType]), set())
+                continue
             sourceSet = set()
             sinkSet = set()
             for pip in tile.pips:
-                if assumeSourceSinkNames:
-                    if GNDRE.match(pip[0]) or VCCRE.match(pip[0]) or VDDRE.match(pip[0]):
-                        sourceSet.add(pip[0])
-                else:
-                    if (tileLoc + "." + pip[0]) not in allFabricOutputs:
-                        sourceSet.add(pip[0])
-                    if (tileLoc + "." + pip[1]) not in allFabricInputs:
-                        sinkSet.add(pip[1])
+                if f"{tileLoc}.{pip[0]}" not in allFabricOutputs:
+                    sourceSet.add(pip[0])
+                if f"{tileLoc}.{pip[1]}" not in allFabricInputs:
+                    sinkSet.add(pip[1])
             returnDict[tileLoc] = (sourceSet, sinkSet)
 
     return returnDict
 
 
+# The prefixed input and output port names of a BEL and whether it has a clock input.
+# Shared by every tile using the BEL, so the ports are kept as tuples.
+class _BelPortInfo(NamedTuple):
+    inputPorts: Tuple[str, ...]
+    outputPorts: Tuple[str, ...]
+    hasClockInput: bool
+
+
+# Get the prefixed input and output port names of a BEL and whether it has a clock input
+def _getBelPortInfo(belFile: str, prefix: str) -> _BelPortInfo:
+    belHasClockInput = False
+    try:
+        ports = GetComponentPortsFromFile(belFile)
+        # We also want to check whether the component has a clock input
+        # Get all external (routed to top) ports
+        externalPorts = (GetComponentPortsFromFile(
+            belFile, port="external"))
+        for port in externalPorts:
+            # Get port name
+            PortName = port.split(':', 1)[0].translate(_STRIP_BLANKS)
+            if PortName == "UserCLK":  # And if UserCLK is in there then we have a clock input
+                belHasClockInput = True
+
+    except:
+        raise Exception(f"{belFile} file for BEL not found")
+
+    inputPorts = tuple(prefix + _PORT_INDEX_RE.sub("", str(port))
+                       for port in ports[0])
+    outputPorts = tuple(prefix + _PORT_INDEX_RE.sub("", str(port))
+                        for port in ports[1])
+    return _BelPortInfo(inputPorts, outputPorts, belHasClockInput)
+
+
+# Use up one declaration of a wire port of a tile, a port connected more often than it is declared is an error
+def _usePort(ports: Counter, port: str):
+    if ports[port] <= 0:
+        raise ValueError(f"{port} is not a free port of the tile")
+    ports[port] -= 1
+
+
+class _TileTypeInfo(NamedTuple):
+    matrixFileName: Optional[str]
+    pips: Optional[tuple]
+    belPorts: List[str]
+    bels: List[list]
+    belsWithIO: List[list]
+    ports: Counter
+    wires: List[dict]
+    jumpWires: List[dict]
+
+
+# Parse the description of a tile type for genFabricObject. The matrix and BEL results are shared through
+# matrixPips and belInfo, as different tile types can use the same files
+def _parseTileType(tileList: list, matrixPips: dict, belInfo: dict) -> _TileTypeInfo:
+    matrixFileName = None
+    pips = None
+    belPorts = []
+    belList = []
+    belListWithIO = []
+    portList = Counter()
+    wireTextList = []
+    jumpWires = []
+    for wire in tileList:
+        # Handle tile attributes depending on their label
+        if wire[0] == "MATRIX":
+            vhdlLoc = wire[1]
+            # csvLoc = vhdlLoc[:-4:] + "csv"
+            csvLoc = vhdlLoc.replace(".vhdl", ".csv")
+            csvLoc = vhdlLoc.replace(".list", ".csv")
+            csvLoc = vhdlLoc.replace(".v", ".csv")
+            matrixFileName = csvLoc
+            try:
+                # every tile of a type shares its matrix, so each CSV file is only opened and parsed once
+                if csvLoc not in matrixPips:
+                    with open(csvLoc) as f:
+                        csvFile = RemoveComments(
+                            [i.strip('\n').split(',') for i in f])
+                    matrixPips[csvLoc] = findPipListAll(csvFile)
+                pips = matrixPips[csvLoc]
+
+            except:
+                raise Exception("CSV File not found.")
+
+        if wire[0] == "BEL":
+            if len(wire) > 2:
+                prefix = wire[2]
+            else:
+                prefix = ""
+            # the BEL ports only depend on the BEL file and its prefix, so they are worked out once
+            # for all the tiles using that BEL
+            if (wire[1], prefix) not in belInfo:
+                belInfo[(wire[1], prefix)] = _getBelPortInfo(
+                    wire[1], prefix)
+            info = belInfo[(wire[1], prefix)]
+            nports = list(info.inputPorts + info.outputPorts)
+            belPorts.extend(nports)
+
+            belListWithIO.append(
+                [wire[1][0:-5:], prefix, list(info.inputPorts), list(info.outputPorts), info.hasClockInput])
+            belList.append(
+                [wire[1][0:-5:], prefix, nports, info.hasClockInput])
+
+        elif wire[0] in _WIRE_DIRECTIONS:
+            # Wires are added in next pass - this pass generates port lists to be used for wire generation
+            if wire[1] != "NULL":
+                portList[wire[1]] += 1
+            if wire[4] != "NULL":
+                portList[wire[4]] += 1
+            wireTextList.append({"direction": wire[0], "source": wire[1], "xoffset": wire[2],
+                                 "yoffset": wire[3], "destination": wire[4], "wire-count": wire[5]})
+        # We just treat JUMPs as normal wires - however they're only on one tile so we can add them directly
+        elif wire[0] == "JUMP":
+            if "NULL" not in wire:
+                jumpWires.append({"direction": wire[0], "source": wire[1], "xoffset": wire[2],
+                                  "yoffset": wire[3], "destination": wire[4], "wire-count": wire[5]})
+    return _TileTypeInfo(matrixFileName, pips, belPorts, belList, belListWithIO, portList, wireTextList, jumpWires)
+
+
+# The fields of a wire dict used to connect the wires of a tile: the dict itself, its direction, source and destination,
+# the integer offsets and wire count, whether any field is NULL, and the step (xStep, yStep) to the first tile the wire
+# goes through with the number of tiles it spans. A wire moving in the x axis is stepped along x and keeps its y
+# offset, otherwise it is stepped along y
+class _WireFields(NamedTuple):
+    wire: dict
+    direction: str
+    source: str
+    destination: str
+    xOffset: int
+    yOffset: int
+    wireCount: int
+    hasNull: bool
+    xStep: int
+    yStep: int
+    span: int
+
+
+def _getWireFields(wire: dict) -> _WireFields:
+    xOffset = int(wire["xoffset"])
+    yOffset = int(wire["yoffset"])
+    if xOffset != 0:
+        xStep, yStep, span = (1 if xOffset > 0 else -1), yOffset, abs(xOffset)
+    else:
+        xStep, yStep, span = 0, (1 if yOffset > 0 else -1), abs(yOffset)
+    return _WireFields(wire, wire["direction"], wire["source"], wire["destination"], xOffset, yOffset,
+                       int(wire["wire-count"]), "NULL" in wire.values(), xStep, yStep, span)
+
+
+# A wire spanning more than one tile is split into atomic wires to the neighbouring tile at (xStep, yStep), the first
+# tile the wire goes through, which are added to atomicWires. With wrapAround the wire indices are rotated and the
+# wires passing through are jumped back to the beginning of the wire
+def _addCascadedWires(archFabric: FabricModelGen, portMap: dict, tile: TileModelGen, tileLoc: str,
+                      atomicWires: list, fields: _WireFields, destinationName: str, wrapAround: bool):
+    source, wireCount, xStep, yStep = fields.source, fields.wireCount, fields.xStep, fields.yStep
+    cTile = archFabric.getTileByCoords(
+        tile.x + xStep, tile.y + yStep)  # destination tile
+    cTileLoc = cTile.genTileLoc()
+    total = wireCount*fields.span
+    # the destination index of every single wire is laid out up front: with wrapAround the first wireCount wires end
+    # at the far end of the wire and the ones after them are shifted back by one tile, otherwise every wire keeps its
+    # index
+    if wrapAround:
+        destinationIndices = chain(range(total - wireCount, total), range(total - wireCount))
+    else:
+        destinationIndices = range(total)
+    # bound once, as one entry is appended per single wire
+    addAtomicWire = atomicWires.append
+    for i, destinationIndex in enumerate(destinationIndices):
+        sourceName = f"{source}{i}"
+        if wrapAround and i >= wireCount:
+            addAtomicWire(AtomicWire("JUMP", f"{fields.destination}{i}", 0, 0, sourceName,
+                                     tileLoc, tileLoc))
+        addAtomicWire(AtomicWire(fields.direction, sourceName, xStep, yStep,
+                                 f"{destinationName}{destinationIndex}",
+                                 tileLoc, cTileLoc))  # Add atomic wire names
+    _usePort(portMap[cTile], destinationName)
+    _usePort(portMap[tile], source)
+
+
 def genFabricObject(fabric: list, FabricFile):
     # The following iterates through the tile designations on the fabric
     archFabric = FabricModelGen(len(fabric), len(fabric[0]))
@@ -735,355 +969,127 @@ def genFabricObject(fabric: list, FabricFile):
     #                     portList.append(wire[4])
     #         portMap["I" + str(i) + "J" + str(j)] = portList
 
+    # every tile type is looked up once instead of scanning the whole fabric file for every cell
+    tileDescriptions = {tile: GetTileFromFile(FabricFile, tile)
+                        for tile in dict.fromkeys(tile for line in fabric for tile in line)}
+
+    matrixPips = {}
+    belInfo = {}
+    # every tile type is parsed once, in the order the types first appear in the fabric, and the tiles of a type
+    # only copy the result
+    tileTypes = {}
+
     for i, line in enumerate(fabric):
         row = []
         for j, tile in enumerate(line):
             cTile = TileModelGen(tile)
-            wires = []
-            belList = []
-            belListWithIO = []
-            tileList = GetTileFromFile(FabricFile, tile)
-            portList = []
-            wireTextList = []
-            for wire in tileList:
-                # Handle tile attributes depending on their label
-                if wire[0] == "MATRIX":
-                    vhdlLoc = wire[1]
-                    # csvLoc = vhdlLoc[:-4:] + "csv"
-                    csvLoc = vhdlLoc.replace(".vhdl", ".csv")
-                    csvLoc = vhdlLoc.replace(".list", ".csv")
-                    csvLoc = vhdlLoc.replace(".v", ".csv")
-                    cTile.matrixFileName = csvLoc
-                    try:
-                        csvFile = RemoveComments(
-                            [i.strip('\n').split(',') for i in open(csvLoc)])
-                        cTile.pips = findPipList(csvFile)
-
-                        cTile.pipMuxes_MapSourceToSinks = findPipList(
-                            csvFile, returnDict=True, mapSourceToSinks=True)
-                        cTile.pipMuxes_MapSinkToSources = findPipList(
-                            csvFile, returnDict=True, mapSourceToSinks=False)
-
-                    except:
-                        raise Exception("CSV File not found.")
-
-                if wire[0] == "BEL":
-                    belHasClockInput = False
-                    try:
-                        ports = GetComponentPortsFromFile(wire[1])
-                        # We also want to check whether the component has a clock input
-                        # Get all external (routed to top) ports
-                        externalPorts = (GetComponentPortsFromFile(
-                            wire[1], port="external"))
-                        for port in externalPorts:
-                            # Get port name
-                            PortName = re.sub('\:.*', '', port)
-                            substitutions = {" ": "", "\t": ""}  # Strip
-                            PortName = (replace(PortName, substitutions))
-                            if PortName == "UserCLK":  # And if UserCLK is in there then we have a clock input
-                                belHasClockInput = True
-
-                    except:
-                        raise Exception(f"{wire[1]} file for BEL not found")
-
-                    if len(wire) > 2:
-                        prefix = wire[2]
-                    else:
-                        prefix = ""
-                    nports = []
-                    inputPorts = []
-                    outputPorts = []
-
-                    for port in ports[0]:
-                        nports.append(
-                            prefix + re.sub(" *\(.*\) *", "", str(port)))
-                        # Also add to distinct input/output lists
-                        inputPorts.append(
-                            prefix + re.sub(" *\(.*\) *", "", str(port)))
-                    for port in ports[1]:
-                        nports.append(
-                            prefix + re.sub(" *\(.*\) *", "", str(port)))
-                        outputPorts.append(
-                            prefix + re.sub(" *\(.*\) *", "", str(port)))
-                    cTile.belPorts.update(nports)
-
-                    belListWithIO.append(
-                        [wire[1][0:-5:], prefix, inputPorts, outputPorts, belHasClockInput])
-                    belList.append(
-                        [wire[1][0:-5:], prefix, nports, belHasClockInput])
-
-                elif wire[0] in ["NORTH", "SOUTH", "EAST", "WEST"]:
-                    # Wires are added in next pass - this pass generates port lists to be used for wire generation
-                    if wire[1] != "NULL":
-                        portList.append(wire[1])
-                    if wire[4] != "NULL":
-                        portList.append(wire[4])
-                    wireTextList.append({"direction": wire[0], "source": wire[1], "xoffset": wire[2],
-                                        "yoffset": wire[3], "destination": wire[4], "wire-count": wire[5]})
-                # We just treat JUMPs as normal wires - however they're only on one tile so we can add them directly
-                elif wire[0] == "JUMP":
-                    if "NULL" not in wire:
-                        wires.append({"direction": wire[0], "source": wire[1], "xoffset": wire[2],
-                                     "yoffset": wire[3], "destination": wire[4], "wire-count": wire[5]})
-            cTile.wires = wires
+            if tile not in tileTypes:
+                tileTypes[tile] = _parseTileType(tileDescriptions[tile], matrixPips, belInfo)
+            info = tileTypes[tile]
+            if info.matrixFileName is not None:
+                cTile.matrixFileName = info.matrixFileName
+                (cTile.pips, cTile.pipMuxes_MapSourceToSinks,
+                 cTile.pipMuxes_MapSinkToSources) = info.pips
+            cTile.belPorts.update(info.belPorts)
+            # the wires of the tile get the cascaded wires added in the next pass
+            cTile.wires = list(info.jumpWires)
             cTile.x = j
             # cTile.y = archFabric.height - i -1
             cTile.y = i
 
-            cTile.bels = belList
-            cTile.belsWithIO = belListWithIO
+            cTile.bels = list(info.bels)
+            cTile.belsWithIO = list(info.belsWithIO)
             row.append(cTile)
-            portMap[cTile] = portList
-            wireMap[cTile] = wireTextList
+            # the wire ports of the tile with how often they are declared, every wire connected in the next pass
+            # uses up one of them
+            portMap[cTile] = Counter(info.ports)
+            wireMap[cTile] = info.wires
         archFabric.tiles.append(row)
 
         # Add wires to model
 
+    # all the tiles are placed, so the coordinate lookups of the wire pass below can use the index
+    archFabric.indexTiles()
+    # the fields of the wires read in the wire pass, converted once per tile type as all the tiles of a type share
+    # the same wire dicts
+    wireFields = {}
     for row in archFabric.tiles:
         for tile in row:
+            tileLoc = tile.genTileLoc()
             wires = []
-            wireTextList = wireMap[tile]
+            if tile.tileType not in wireFields:
+                wireFields[tile.tileType] = [_getWireFields(wire) for wire in wireMap[tile]]
             tempAtomicWires = []
+
             # Wires from tile
-            for wire in wireTextList:
-                xOffset = int(wire["xoffset"])
-                yOffset = int(wire["yoffset"])
-                wireCount = int(wire["wire-count"])
+            for fields in wireFields[tile.tileType]:
+                source, destination = fields.source, fields.destination
+                xOffset, yOffset = fields.xOffset, fields.yOffset
                 destinationTile = archFabric.getTileByCoords(
                     tile.x + xOffset, tile.y + yOffset)
-                if abs(xOffset) <= 1 and abs(yOffset) <= 1 and not ("NULL" in wire.values()):
-                    wires.append(wire)
-                    portMap[destinationTile].remove(wire["destination"])
-                    portMap[tile].remove(wire["source"])
+                if abs(xOffset) <= 1 and abs(yOffset) <= 1 and not fields.hasNull:
+                    wires.append(fields.wire)
+                    _usePort(portMap[destinationTile], destination)
+                    _usePort(portMap[tile], source)
                 # If the wire goes off the fabric then we account for cascading by finding the last tile the wire goes through
-                elif not ("NULL" in wire.values()):
-                    if xOffset != 0:  # If we're moving in the x axis
-                        if xOffset > 1:
-                            cTile = archFabric.getTileByCoords(
-                                tile.x + 1, tile.y + yOffset)  # destination tile
-                            for i in range(wireCount*abs(xOffset)):
-                                if i < wireCount:
-                                    cascaded_i = i + \
-                                        wireCount * \
-                                        (abs(xOffset)-1)
-                                else:
-                                    cascaded_i = i - wireCount
-                                    tempAtomicWires.append({"direction": "JUMP",
-                                                            "source": wire["destination"] + str(i),
-                                                            "xoffset": '0',
-                                                            "yoffset": '0',
-                                                            "destination": wire["source"] + str(i),
-                                                            "sourceTile": tile.genTileLoc(),
-                                                            "destTile": tile.genTileLoc()})
-                                tempAtomicWires.append({"direction": wire["direction"],
-                                                        "source": wire["source"] + str(i),
-                                                        "xoffset": '1',
-                                                        "yoffset": wire["yoffset"],
-                                                        "destination": wire["destination"] + str(cascaded_i),
-                                                        "sourceTile": tile.genTileLoc(),
-                                                        "destTile": cTile.genTileLoc()})  # Add atomic wire names
-                            portMap[cTile].remove(wire["destination"])
-                            portMap[tile].remove(wire["source"])
-                        elif xOffset < -1:
-                            cTile = archFabric.getTileByCoords(
-                                tile.x - 1, tile.y + yOffset)  # destination tile
-                            for i in range(wireCount*abs(xOffset)):
-                                if i < wireCount:
-                                    cascaded_i = i + \
-                                        wireCount * \
-                                        (abs(xOffset)-1)
-                                else:
-                                    cascaded_i = i - wireCount
-                                    tempAtomicWires.append({"direction": "JUMP",
-                                                            "source": wire["destination"] + str(i),
-                                                            "xoffset": '0',
-                                                            "yoffset": '0',
-                                                            "destination": wire["source"] + str(i),
-                                                            "sourceTile": tile.genTileLoc(),
-                                                            "destTile": tile.genTileLoc()})
-                                tempAtomicWires.append({"direction": wire["direction"],
-                                                        "source": wire["source"] + str(i),
-                                                        "xoffset": '-1',
-                                                        "yoffset": wire["yoffset"],
-                                                        "destination": wire["destination"] + str(cascaded_i),
-                                                        "sourceTile": tile.genTileLoc(),
-                                                        "destTile": cTile.genTileLoc()})  # Add atomic wire names
-                            portMap[cTile].remove(wire["destination"])
-                            portMap[tile].remove(wire["source"])
-                    elif yOffset != 0:  # If we're moving in the y axis
-                        if yOffset > 1:
-                            cTile = archFabric.getTileByCoords(
-                                tile.x + xOffset, tile.y + 1)  # destination tile
-                            for i in range(wireCount*abs(yOffset)):
-                                if i < wireCount:
-                                    cascaded_i = i + \
-                                        wireCount * \
-                                        (abs(yOffset)-1)
-                                else:
-                                    cascaded_i = i - wireCount
-                                    tempAtomicWires.append({"direction": "JUMP",
-                                                            "source": wire["destination"] + str(i),
-                                                            "xoffset": '0',
-                                                            "yoffset": '0',
-                                                            "destination": wire["source"] + str(i),
-                                                            "sourceTile": tile.genTileLoc(),
-                                                            "destTile": tile.genTileLoc()})
-                                tempAtomicWires.append({"direction": wire["direction"],
-                                                        "source": wire["source"] + str(i),
-                                                        "xoffset": wire["xoffset"],
-                                                        "yoffset": '1',
-                                                        "destination": wire["destination"] + str(cascaded_i),
-                                                        "sourceTile": tile.genTileLoc(),
-                                                        "destTile": cTile.genTileLoc()})  # Add atomic wire names
-
-                            portMap[cTile].remove(wire["destination"])
-                            portMap[tile].remove(wire["source"])
-                        elif yOffset < -1:
-                            cTile = archFabric.getTileByCoords(
-                                tile.x + xOffset, tile.y - 1)  # destination tile
-                            for i in range(wireCount*abs(yOffset)):
-                                if i < wireCount:
-                                    cascaded_i = i + \
-                                        wireCount * \
-                                        (abs(yOffset)-1)
-                                else:
-                                    cascaded_i = i - wireCount
-                                    tempAtomicWires.append({"direction": "JUMP",
-                                                            "source": wire["destination"] + str(i),
-                                                            "xoffset": '0',
-                                                            "yoffset": '0',
-                                                            "destination": wire["source"] + str(i),
-                                                            "sourceTile": tile.genTileLoc(),
-                                                            "destTile": tile.genTileLoc()})
-                                tempAtomicWires.append({"direction": wire["direction"],
-                                                        "source": wire["source"] + str(i),
-                                                        "xoffset": wire["xoffset"],
-                                                        "yoffset": '-1',
-                                                        "destination": wire["destination"] + str(cascaded_i),
-                                                        "sourceTile": tile.genTileLoc(),
-                                                        "destTile": cTile.genTileLoc()})  # Add atomic wire names
-
-                            portMap[cTile].remove(wire["destination"])
-                            portMap[tile].remove(wire["source"])
-                elif wire["source"] != "NULL" and wire["destination"] == "NULL":
-                    source_wire_name = wire["source"]
-                    if source_wire_name == 'Co':
+                elif not fields.hasNull:
+                    if fields.span > 1:
+                        _addCascadedWires(archFabric, portMap, tile, tileLoc, tempAtomicWires, fields,
+                                          destination, True)
+                elif source != "NULL" and destination == "NULL":
+                    if source == 'Co':
                         dest_wire_name = 'Ci'
-                    elif source_wire_name[1] == '2' and source_wire_name[-1] == 'b':
-                        dest_wire_name = wire["source"].replace("BEGb", "END")
-                    elif source_wire_name[1] == '2' and source_wire_name[-1] != 'b':
-                        dest_wire_name = wire["source"].replace("BEG", "MID")
+                    elif source[1] == '2' and source[-1] == 'b':
+                        dest_wire_name = source.replace("BEGb", "END")
+                    elif source[1] == '2' and source[-1] != 'b':
+                        dest_wire_name = source.replace("BEG", "MID")
                     else:
-                        dest_wire_name = wire["source"].replace("BEG", "END")
-                    if xOffset != 0:  # If we're moving in the x axis
-                        if xOffset > 0:
-                            cTile = archFabric.getTileByCoords(
-                                tile.x + 1, tile.y + yOffset)  # destination tile
-                            for i in range(wireCount*abs(xOffset)):
-                                tempAtomicWires.append({"direction": wire["direction"],
-                                                        "source": wire["source"] + str(i),
-                                                        "xoffset": '1', "yoffset": wire["yoffset"],
-                                                       "destination": dest_wire_name + str(i),
-                                                        "sourceTile": tile.genTileLoc(),
-                                                        "destTile": cTile.genTileLoc()})  # Add atomic wire names
-                            portMap[cTile].remove(dest_wire_name)
-                            portMap[tile].remove(wire["source"])
-                        elif xOffset < 0:
-                            cTile = archFabric.getTileByCoords(
-                                tile.x - 1, tile.y + yOffset)  # destination tile
-                            for i in range(wireCount*abs(xOffset)):
-                                tempAtomicWires.append({"direction": wire["direction"],
-                                                        "source": wire["source"] + str(i),
-                                                        "xoffset": '-1',
-                                                        "yoffset": wire["yoffset"],
-                                                        "destination": dest_wire_name + str(i),
-                                                        "sourceTile": tile.genTileLoc(),
-                                                        "destTile": cTile.genTileLoc()})  # Add atomic wire names
-                            portMap[cTile].remove(dest_wire_name)
-                            portMap[tile].remove(wire["source"])
-                    elif yOffset != 0:  # If we're moving in the y axis
-                        if yOffset > 0:
-                            cTile = archFabric.getTileByCoords(
-                                tile.x + xOffset, tile.y + 1)  # destination tile
-                            for i in range(wireCount*abs(yOffset)):
-                                tempAtomicWires.append({"direction": wire["direction"],
-                                                        "source": wire["source"] + str(i),
-                                                        "xoffset": wire["xoffset"],
-                                                        "yoffset": '1',
-                                                        "destination": dest_wire_name + str(i),
-                                                        "sourceTile": tile.genTileLoc(),
-                                                        "destTile": cTile.genTileLoc()})  # Add atomic wire names
-                            portMap[cTile].remove(dest_wire_name)
-                            portMap[tile].remove(wire["source"])
-                        elif yOffset < 0:
-                            cTile = archFabric.getTileByCoords(
-                                tile.x + xOffset, tile.y - 1)  # destination tile
-                            for i in range(wireCount*abs(yOffset)):
-                                tempAtomicWires.append({"direction": wire["direction"],
-                                                        "source": wire["source"] + str(i),
-                                                        "xoffset": wire["xoffset"],
-                                                        "yoffset": '-1',
-                                                        "destination": dest_wire_name + str(i),
-                                                        "sourceTile": tile.genTileLoc(),
-                                                        "destTile": cTile.genTileLoc()})  # Add atomic wire names
-                            portMap[cTile].remove(dest_wire_name)
-                            portMap[tile].remove(wire["source"])
+                        dest_wire_name = source.replace("BEG", "END")
+                    if fields.span > 0:
+                        _addCascadedWires(archFabric, portMap, tile, tileLoc, tempAtomicWires, fields,
+                                          dest_wire_name, False)
 
             tile.wires.extend(wires)
             tile.atomicWires = tempAtomicWires
 
     archFabric.cellTypes = GetCellTypes(fabric)
+    archFabric.indexWireDestinations()
 
     return archFabric
 
 
 def genVerilogTemplate(archObject: FabricModelGen):
-    templateStr = '// IMPORTANT NOTE: if using VPR, any instantiated BELs with no outputs MUST be instantiated after IO\n'
-    templateStr += '// This is because VPR auto-generates names for primitives with no outputs, and we assume OutPass BELs\n'
-    templateStr += '// are the first BELs to be auto-named in our constraints file.\n\n'
-
-    templateStr += "module template ();\n"
+    # the template is collected as a list of parts and joined once at the end
+    templateStr = ['// IMPORTANT NOTE: if using VPR, any instantiated BELs with no outputs MUST be instantiated after IO\n',
+                   '// This is because VPR auto-generates names for primitives with no outputs, and we assume OutPass BELs\n',
+                   '// are the first BELs to be auto-named in our constraints file.\n\n',
+                   "module template ();\n"]
     for line in archObject.tiles:
         for tile in line:
+            tileLoc = tile.genTileLoc()
             for num, belpair in enumerate(tile.bels):
                 bel = belpair[0]
                 let = letters[num]
                 prefix = belpair[1]
                 nports = belpair[2]
-                tileLoc = tile.genTileLoc()
                 # Add template - this just adds to a file to instantiate all IO as a primitive:
-                if bel == "IO_1_bidirectional_frame_config_pass":
-                    templateStr += f"wire "
-                    for i, port in enumerate(nports):
-                        templateStr += f"Tile_{tileLoc}_{port}"
-                        if i < len(nports) - 1:
-                            templateStr += ", "
-                        else:
-                            templateStr += ";\n"
+                if bel in ("IO_1_bidirectional_frame_config_pass", "InPass4_frame_config", "OutPass4_frame_config"):
+                    templateStr.append("wire ")
+                    if nports:
+                        templateStr.append(
+                            ", ".join(f"Tile_{tileLoc}_{port}" for port in nports) + ";\n")
                     belName = f"Tile_{tileLoc}_{let}"
-                    templateStr += f"(* keep *) IO_1_bidirectional_frame_config_pass {belName} (.O(Tile_{tileLoc}_{prefix}O), .Q(Tile_{tileLoc}_{prefix}Q), .I(Tile_{tileLoc}_{prefix}I));\n\n"
+                if bel == "IO_1_bidirectional_frame_config_pass":
+                    templateStr.append(
+                        f"(* keep *) IO_1_bidirectional_frame_config_pass {belName} (.O(Tile_{tileLoc}_{prefix}O), .Q(Tile_{tileLoc}_{prefix}Q), .I(Tile_{tileLoc}_{prefix}I));\n\n")
                 if bel == "InPass4_frame_config":
-                    templateStr += f"wire "
-                    for i, port in enumerate(nports):
-                        templateStr += f"Tile_{tileLoc}_{port}"
-                        if i < len(nports) - 1:
-                            templateStr += ", "
-                        else:
-                            templateStr += ";\n"
-                    belName = f"Tile_{tileLoc}_{let}"
-                    templateStr += f"(* keep *) InPass4_frame_config {belName} (.O0(Tile_{tileLoc}_{prefix}O0), .O1(Tile_{tileLoc}_{prefix}O1), .O2(Tile_{tileLoc}_{prefix}O2), .O3(Tile_{tileLoc}_{prefix}O3));\n\n"
+                    templateStr.append(
+                        f"(* keep *) InPass4_frame_config {belName} (.O0(Tile_{tileLoc}_{prefix}O0), .O1(Tile_{tileLoc}_{prefix}O1), .O2(Tile_{tileLoc}_{prefix}O2), .O3(Tile_{tileLoc}_{prefix}O3));\n\n")
                 if bel == "OutPass4_frame_config":
-                    templateStr += f"wire "
-                    for i, port in enumerate(nports):
-                        templateStr += f"Tile_{tileLoc}_{port}"
-                        if i < len(nports) - 1:
-                            templateStr += ", "
-                        else:
-                            templateStr += ";\n"
-                    belName = f"Tile_{tileLoc}_{let}"
-                    templateStr += f"(* keep *) OutPass4_frame_config {belName} (.I0(Tile_{tileLoc}_{prefix}I0), .I1(Tile_{tileLoc}_{prefix}I1), .I2(Tile_{tileLoc}_{prefix}I2), .I3(Tile_{tileLoc}_{prefix}I3));\n\n"
-    templateStr += "endmodule"
-    return templateStr
+                    templateStr.append(
+                        f"(* keep *) OutPass4_frame_config {belName} (.I0(Tile_{tileLoc}_{prefix}I0), .I1(Tile_{tileLoc}_{prefix}I1), .I2(Tile_{tileLoc}_{prefix}I2), .I3(Tile_{tileLoc}_{prefix}I3));\n\n")
+    templateStr.append("endmodule")
+    return "".join(templateStr)
 
 
 if __name__ == '__main__':